@@ -4,13 +4,33 @@ Bootstrap script for PRDY
 Automatically sets up the complete environment including AI providers
 """
 
+import io
 import os
 import sys
+import hashlib
+import functools
+import importlib.util
+import json
 import subprocess
 import shutil
 import platform
+import sysconfig
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Always run pip through this interpreter so packages land in its environment
+PIP_INSTALL = [sys.executable, "-m", "pip", "install"]
+
+# pip byte-compiles serially; defer that to a parallel compileall run instead
+PIP_ENV = {**os.environ, "PIP_COMPILE": "0"}
+
+# PATH lookups are repeated across checks; PATH does not change during a run
+cached_which = functools.lru_cache(maxsize=None)(shutil.which)
+
+# Marker fingerprinting the inputs of the last successful install
+DEPS_STAMP_FILE = Path.home() / ".prd-generator" / ".deps-stamp"
+
 def print_header():
     print("""
     ╔══════════════════════════════════════╗
@@ -29,6 +49,17 @@ def check_python_version():
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     return True
 
+def probe_dependency(dep):
+    """Check whether a single system dependency is available"""
+    cmd, desc = dep
+    if cmd == "pip":
+        # pip is always invoked as 'sys.executable -m pip', so check that this
+        # interpreter can import it rather than probing executables on PATH
+        found = importlib.util.find_spec("pip") is not None
+    else:
+        found = cached_which(cmd)
+    return cmd, desc, bool(found)
+
 def check_system_dependencies():
     """Check for required system dependencies"""
     deps = {
@@ -38,108 +69,130 @@ def check_system_dependencies():
         "pip": "pip (Python package manager)"
     }
     
+    # Probe concurrently, then report in declaration order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(probe_dependency, deps.items()))
+    
     missing = []
-    for cmd, desc in deps.items():
-        if cmd == "pip":
-            # Check for pip in various forms
-            pip_found = (shutil.which("pip") or 
-                        shutil.which("pip3") or 
-                        shutil.which("python3") and subprocess.run([sys.executable, "-m", "pip", "--version"], 
-                                                                  capture_output=True).returncode == 0)
-        else:
-            pip_found = shutil.which(cmd)
-            
-        if pip_found:
-            print(f"✅ {desc}")
+    lines = []
+    for cmd, desc, found in results:
+        if found:
+            lines.append(f"✅ {desc}")
         else:
-            print(f"❌ {desc} - not found")
+            lines.append(f"❌ {desc} - not found")
             missing.append((cmd, desc))
+    print("\n".join(lines))
     
     return missing
 
+@functools.lru_cache(maxsize=1)
+def read_requirements_file():
+    """Read requirements.txt once per run"""
+    with open("requirements.txt", "rb") as f:
+        return f.read()
+
+def get_dependencies_stamp():
+    """Fingerprint requirements.txt, pyproject.toml, this checkout and the target interpreter"""
+    # Hash in fixed-size blocks so memory stays constant on the cache-hit path
+    digest = hashlib.sha256()
+    for filename in ("requirements.txt", "pyproject.toml"):
+        if not os.path.exists(filename):
+            continue
+        with open(filename, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                digest.update(block)
+    files_hash = digest.hexdigest()
+    # The editable install points at one checkout, so a different path must reinstall
+    project_dir = str(Path.cwd().resolve())
+    return "\n".join([files_hash, project_dir, sys.prefix, sys.version, platform.platform()])
+
+def read_requirements():
+    """Parse requirement specifiers from requirements.txt"""
+    lines = read_requirements_file().decode().splitlines()
+    return [line.strip() for line in lines
+            if line.strip() and not line.strip().startswith("#")]
+
+def install_requirement(requirement):
+    """Install a single requirement without its dependencies"""
+    # Output is discarded rather than buffered; the serial pass reports errors
+    result = subprocess.run(
+        PIP_INSTALL + ["--no-deps", requirement],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=PIP_ENV
+    )
+    return requirement, result.returncode == 0
+
+def compile_site_packages():
+    """Byte-compile installed packages using all CPU cores"""
+    print("🔄 Compiling installed packages...")
+    result = subprocess.run(
+        [sys.executable, "-m", "compileall", "-q", "-j", str(os.cpu_count() or 1),
+         sysconfig.get_paths()["purelib"]],
+        stdout=subprocess.DEVNULL
+    )
+    if result.returncode != 0:
+        print("⚠️  Some packages could not be byte-compiled")
+
 def install_dependencies():
-    """Install Python dependencies"""
-    print("\n📦 Installing Python dependencies...")
+    """Install Python dependencies and the PRDY package"""
+    print("\n📦 Installing Python dependencies and PRDY package...")
     
     try:
-        # Try different pip commands with fallback options
-        pip_commands = [
-            f"{sys.executable} -m pip install -r requirements.txt",
-            f"{sys.executable} -m pip install -r requirements.txt --user",
-            f"{sys.executable} -m pip install -r requirements.txt --break-system-packages",
-            "pip3 install -r requirements.txt",
-            "pip3 install -r requirements.txt --user", 
-            "pip3 install -r requirements.txt --break-system-packages",
-            "pip install -r requirements.txt",
-            "pip install -r requirements.txt --user",
-            "pip install -r requirements.txt --break-system-packages"
-        ]
+        stamp = get_dependencies_stamp()
+        if DEPS_STAMP_FILE.exists() and DEPS_STAMP_FILE.read_text() == stamp:
+            print("✅ dependencies cache hit")
+            return True
         
-        for pip_cmd in pip_commands:
-            try:
-                print(f"🔄 Trying: {pip_cmd}")
-                result = subprocess.run(
-                    pip_cmd.split(),
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                print("✅ Python dependencies installed successfully")
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                print(f"⚠️  Command failed: {e}")
-                continue
+        # Download and install packages concurrently; --no-deps keeps the
+        # workers from racing on shared transitive dependencies
+        requirements = read_requirements()
+        max_workers = min(os.cpu_count() or 1, 8)
+        print(f"🔄 Installing {len(requirements)} packages with {max_workers} workers")
         
-        print("❌ Failed to install dependencies with any pip command")
-        print("💡 Try creating a virtual environment:")
-        print("   python3 -m venv prdy-env")
-        print("   source prdy-env/bin/activate")
-        print("   pip install -r requirements.txt")
-        return False
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for requirement, ok in executor.map(install_requirement, requirements):
+                if not ok:
+                    failed.append(requirement)
         
-    except Exception as e:
-        print(f"❌ Error installing dependencies: {e}")
-        return False
-
-def install_package():
-    """Install the PRDY package"""
-    print("\n📦 Installing PRDY package...")
-    
-    try:
-        pip_commands = [
-            f"{sys.executable} -m pip install -e .",
-            f"{sys.executable} -m pip install -e . --user",
-            f"{sys.executable} -m pip install -e . --break-system-packages",
-            "pip3 install -e .",
-            "pip3 install -e . --user",
-            "pip3 install -e . --break-system-packages",
-            "pip install -e .",
-            "pip install -e . --user",
-            "pip install -e . --break-system-packages"
-        ]
+        if failed:
+            print(f"⚠️  Parallel install failed for: {', '.join(failed)}")
         
-        for pip_cmd in pip_commands:
-            try:
-                print(f"🔄 Trying: {pip_cmd}")
-                result = subprocess.run(
-                    pip_cmd.split(),
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                print("✅ PRDY package installed successfully")
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                print(f"⚠️  Command failed: {e}")
-                continue
+        # Serial pass installs the package and lets pip resolve dependencies
+        # once in the same invocation, retrying anything that failed above
+        # pip writes straight to the terminal so progress is visible live
+        argv = PIP_INSTALL + ["-e", ".", "-r", "requirements.txt"]
+        try:
+            subprocess.run(
+                argv,
+                check=True,
+                env=PIP_ENV
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Failed to install dependencies: {e}")
+            print("💡 Try creating a virtual environment:")
+            print("   python3 -m venv prdy-env")
+            print("   source prdy-env/bin/activate")
+            print("   pip install -e . -r requirements.txt")
+            return False
         
-        print("❌ Failed to install package")
-        return False
+        print("✅ Python dependencies and PRDY package installed successfully")
+        compile_site_packages()
+        DEPS_STAMP_FILE.parent.mkdir(exist_ok=True)
+        DEPS_STAMP_FILE.write_text(stamp)
+        return True
         
     except Exception as e:
-        print(f"❌ Error installing package: {e}")
+        print(f"❌ Error installing dependencies: {e}")
         return False
 
+def setup_provider(provider_value):
+    """Set up a single AI provider (runs in a worker thread)"""
+    from prdy.utils.ai_integration import AIIntegration, AIProvider
+    
+    return AIIntegration().setup_ai_provider(AIProvider(provider_value))
+
 def setup_ai_environment():
     """Set up AI environment interactively"""
     print("\n🤖 Setting up AI environment...")
@@ -147,30 +200,50 @@ def setup_ai_environment():
     try:
         # Import after package installation
         sys.path.insert(0, '.')
-        from prd_generator.utils.ai_integration import AIIntegration, AIProvider
+        from prdy.utils.ai_integration import AIIntegration, AIProvider
         
         ai_integration = AIIntegration()
-        capabilities = ai_integration.env_manager.detect_capabilities()
+        # Probe fresh: this run may be the one right after installing node or ollama
+        capabilities = ai_integration.env_manager.detect_capabilities(refresh=True)
         
-        print("\nSystem capabilities:")
+        lines = ["\nSystem capabilities:"]
         for cap, available in capabilities.items():
             status = "✅" if available else "❌"
-            print(f"  {status} {cap.replace('_', ' ').title()}")
+            lines.append(f"  {status} {cap.replace('_', ' ').title()}")
+        print("\n".join(lines))
         
         # Auto-setup available providers
+        providers = {}
         if capabilities.get("node_js") and capabilities.get("npm"):
-            print("\n🚀 Setting up Claude Code environment...")
-            if ai_integration.setup_ai_provider(AIProvider.CLAUDE_CODE):
-                print("✅ Claude Code environment ready!")
-            else:
-                print("⚠️  Claude Code setup had issues, but you can try manually later")
-        
+            providers[AIProvider.CLAUDE_CODE] = "Claude Code"
         if capabilities.get("ollama"):
-            print("\n🚀 Setting up Ollama environment...")
-            if ai_integration.setup_ai_provider(AIProvider.OLLAMA):
-                print("✅ Ollama environment ready!")
-            else:
-                print("⚠️  Ollama setup had issues, but you can try manually later")
+            providers[AIProvider.OLLAMA] = "Ollama"
+        
+        if not providers:
+            return True
+        
+        # Both setups are network-bound (npm registry, Ollama service), so
+        # run them side by side and report in completion order
+        print(f"\n🚀 Setting up {' and '.join(providers.values())} environments...")
+        max_workers = min(os.cpu_count() or 1, len(providers))
+        # Threads share one console and config lock; both setups wait on subprocesses and I/O
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(setup_provider, provider.value): name
+                for provider, name in providers.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    ready = future.result()
+                except Exception as e:
+                    print(f"⚠️  {name} setup failed: {e}")
+                    ready = False
+                
+                if ready:
+                    print(f"✅ {name} environment ready!")
+                else:
+                    print(f"⚠️  {name} setup had issues, but you can try manually later")
         
         return True
         
@@ -195,7 +268,6 @@ def create_sample_config():
         
         config_file = config_dir / "config.json"
         if not config_file.exists():
-            import json
             with open(config_file, 'w') as f:
                 json.dump(sample_config, f, indent=2)
             print(f"✅ Configuration created at {config_file}")
@@ -210,25 +282,26 @@ def run_basic_test():
     """Run a basic test to verify installation"""
     print("\n🧪 Running basic functionality test...")
     
+    # Exercise the CLI in-process rather than spawning a new interpreter
     try:
-        result = subprocess.run(
-            ["prd", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        from prdy import cli
         
-        if result.returncode == 0:
+        output = io.StringIO()
+        exit_code = 0
+        with redirect_stdout(output):
+            try:
+                cli.main(["--help"], prog_name="prdy")
+            except SystemExit as e:
+                exit_code = e.code
+        
+        if exit_code in (0, None) and output.getvalue():
             print("✅ PRD Generator CLI is working!")
             return True
         else:
             print("❌ CLI test failed")
-            print(f"   Error: {result.stderr}")
+            print(f"   Exit code: {exit_code}")
             return False
             
-    except subprocess.TimeoutExpired:
-        print("❌ CLI test timed out")
-        return False
     except Exception as e:
         print(f"❌ CLI test error: {e}")
         return False
@@ -303,16 +376,11 @@ def main():
                 print("Installation cancelled.")
                 sys.exit(1)
     
-    # Install dependencies
+    # Install dependencies and package
     if not install_dependencies():
         print("\n❌ Failed to install dependencies")
         sys.exit(1)
     
-    # Install package
-    if not install_package():
-        print("\n❌ Failed to install package")
-        sys.exit(1)
-    
     # Set up AI environment
     setup_ai_environment()
     
@@ -322,7 +390,7 @@ def main():
     # Test installation
     if not run_basic_test():
         print("\n⚠️  Installation completed but CLI test failed")
-        print("   Try running: prd --help")
+        print("   Try running: prdy --help")
     
     # Show next steps
     print_next_steps()
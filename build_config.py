@@ -4,7 +4,9 @@ Build configuration for creating standalone executables
 
 import os
 import sys
+import functools
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Build configuration
@@ -79,6 +81,29 @@ elif PLATFORM == "linux":
     })
 
 
+@functools.lru_cache(maxsize=1)
+def read_requirements():
+    """Read main requirements from requirements.txt (parsed once)"""
+    with open("requirements.txt", "r") as f:
+        return tuple(f.read().strip().split('\n'))
+
+
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds identical content.
+    
+    Leaving unchanged files untouched preserves their mtime, so PyInstaller's
+    incremental build cache stays valid between runs.
+    """
+    path = Path(path)
+    data = content.encode()
+    # Compare and write raw bytes so newline translation can't force a rewrite
+    if path.exists() and path.read_bytes() == data:
+        return False
+    
+    path.write_bytes(data)
+    return True
+
+
 def create_pyinstaller_spec():
     """Create PyInstaller spec file"""
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
@@ -129,8 +154,7 @@ exe = EXE(
 '''
     
     spec_file = Path(f"{PYINSTALLER_CONFIG['name']}.spec")
-    with open(spec_file, 'w') as f:
-        f.write(spec_content)
+    write_if_changed(spec_file, spec_content)
     
     return spec_file
 
@@ -143,15 +167,10 @@ def create_requirements_build():
         "wheel>=0.41.0",
     ]
     
-    # Read main requirements
-    with open("requirements.txt", "r") as f:
-        main_requirements = f.read().strip().split('\n')
-    
-    # Combine
-    all_requirements = main_requirements + build_requirements
+    # Combine with main requirements
+    all_requirements = list(read_requirements()) + build_requirements
     
-    with open("requirements-build.txt", "w") as f:
-        f.write('\n'.join(all_requirements))
+    write_if_changed("requirements-build.txt", '\n'.join(all_requirements))
 
 
 def create_build_script():
@@ -196,11 +215,8 @@ fi
 '''
         script_file = "build.sh"
     
-    with open(script_file, 'w') as f:
-        f.write(script_content)
-    
     # Make executable on Unix-like systems
-    if PLATFORM != "windows":
+    if write_if_changed(script_file, script_content) and PLATFORM != "windows":
         os.chmod(script_file, 0o755)
     
     return script_file
@@ -264,8 +280,7 @@ Section "Uninstall"
 SectionEnd
 '''
         
-        with open("installer.nsi", "w") as f:
-            f.write(nsis_content)
+        write_if_changed("installer.nsi", nsis_content)
     
     elif PLATFORM == "darwin":  # macOS
         # Create DMG creation script
@@ -295,9 +310,8 @@ rm -rf "$TMP_DIR"
 echo "DMG created: $DMG_NAME"
 '''
         
-        with open("create_dmg.sh", "w") as f:
-            f.write(dmg_script)
-        os.chmod("create_dmg.sh", 0o755)
+        if write_if_changed("create_dmg.sh", dmg_script):
+            os.chmod("create_dmg.sh", 0o755)
     
     else:  # Linux
         # Create AppImage configuration
@@ -311,33 +325,36 @@ Comment={APP_DESCRIPTION}
 Terminal=false
 '''
         
-        with open("prd-generator.desktop", "w") as f:
-            f.write(appimage_config)
+        write_if_changed("prd-generator.desktop", appimage_config)
 
 
 def main():
     """Main build configuration setup"""
     print(f"🔧 Setting up build configuration for {PLATFORM}...")
     
-    # Create directories
-    BUILD_DIR.mkdir(exist_ok=True)
-    WORK_DIR.mkdir(exist_ok=True)
-    
-    # Create assets directory if it doesn't exist
+    # Create directories (and assets directory) only if missing
     assets_dir = Path("assets")
-    assets_dir.mkdir(exist_ok=True)
+    for directory in (BUILD_DIR, WORK_DIR, assets_dir):
+        if not directory.is_dir():
+            directory.mkdir()
+    
+    # Create build files (independent writers, so generate them together)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        spec_future = executor.submit(create_pyinstaller_spec)
+        requirements_future = executor.submit(create_requirements_build)
+        script_future = executor.submit(create_build_script)
+        installer_future = executor.submit(create_installer_config)
     
-    # Create build files
-    spec_file = create_pyinstaller_spec()
+    spec_file = spec_future.result()
     print(f"✅ Created PyInstaller spec: {spec_file}")
     
-    create_requirements_build()
+    requirements_future.result()
     print("✅ Created build requirements")
     
-    build_script = create_build_script()
+    build_script = script_future.result()
     print(f"✅ Created build script: {build_script}")
     
-    create_installer_config()
+    installer_future.result()
     print("✅ Created installer configuration")
     
     print(f"\n🚀 Build configuration complete!")
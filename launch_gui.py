@@ -9,14 +9,25 @@ import sys
 import subprocess
 import shutil
 import platform
+import hashlib
+import functools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple, List
 import json
 import tempfile
 
+# Platform detection, resolved once at import
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
 # Color codes for cross-platform terminal output
 class Colors:
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # Windows doesn't support ANSI by default, use simple output
         GREEN = ""
         RED = ""
@@ -36,18 +47,26 @@ class Colors:
         BOLD = "\033[1m"
         RESET = "\033[0m"
 
+# Serializes output from checks running on worker threads
+_print_lock = threading.Lock()
+
 def print_colored(message: str, color: str = ""):
     """Print colored message"""
-    print(f"{color}{message}{Colors.RESET}")
+    with _print_lock:
+        print(f"{color}{message}{Colors.RESET}")
+
+HEADER = "".join(f"{Colors.BLUE}{line}{Colors.RESET}\n" for line in (
+    "╔" + "═" * 50 + "╗",
+    "║" + " " * 18 + "PRDY GUI" + " " * 24 + "║",
+    "║" + " " * 10 + "Product Requirements Document" + " " * 9 + "║",
+    "║" + " " * 19 + "Generator" + " " * 20 + "║",
+    "╚" + "═" * 50 + "╝",
+)) + "\n"
 
 def print_header():
     """Print application header"""
-    print_colored("╔" + "═" * 50 + "╗", Colors.BLUE)
-    print_colored("║" + " " * 18 + "PRDY GUI" + " " * 24 + "║", Colors.BLUE)
-    print_colored("║" + " " * 10 + "Product Requirements Document" + " " * 9 + "║", Colors.BLUE)
-    print_colored("║" + " " * 19 + "Generator" + " " * 20 + "║", Colors.BLUE)
-    print_colored("╚" + "═" * 50 + "╝", Colors.BLUE)
-    print()
+    with _print_lock:
+        sys.stdout.write(HEADER)
 
 def check_python_version() -> bool:
     """Check if Python version is adequate"""
@@ -70,21 +89,15 @@ def check_venv_available() -> bool:
 
 def check_pip_available() -> Tuple[bool, Optional[str]]:
     """Check if pip is available and return the command to use"""
-    pip_commands = [
-        [sys.executable, "-m", "pip"],
-        ["pip3"],
-        ["pip"]
-    ]
-    
-    for cmd in pip_commands:
-        try:
-            result = subprocess.run(cmd + ["--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print_colored("✅ pip available", Colors.GREEN)
-                return True, cmd
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            continue
+    # A module lookup and PATH search are enough; no need to run pip itself
+    if importlib.util.find_spec("pip") is not None:
+        print_colored("✅ pip available", Colors.GREEN)
+        return True, [sys.executable, "-m", "pip"]
+    
+    pip_exe = shutil.which("pip3") or shutil.which("pip")
+    if pip_exe:
+        print_colored("✅ pip available", Colors.GREEN)
+        return True, [pip_exe]
     
     print_colored("❌ pip not available", Colors.RED)
     return False, None
@@ -92,7 +105,7 @@ def check_pip_available() -> Tuple[bool, Optional[str]]:
 def check_git_available() -> bool:
     """Check if git is available"""
     try:
-        subprocess.run(["git", "--version"], capture_output=True, timeout=10)
+        subprocess.run(["git", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         print_colored("✅ Git available", Colors.GREEN)
         return True
     except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
@@ -104,172 +117,263 @@ def bootstrap_pip():
     print_colored("🔄 Attempting to bootstrap pip...", Colors.CYAN)
     try:
         subprocess.run([sys.executable, "-m", "ensurepip", "--default-pip"], 
-                      check=True, capture_output=True)
+                      check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         print_colored("✅ Successfully bootstrapped pip", Colors.GREEN)
         return True
     except subprocess.CalledProcessError:
         print_colored("❌ Failed to bootstrap pip", Colors.RED)
         return False
 
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+APT_INSTALL_COMMANDS = (
+    "sudo apt update",
+    f"sudo apt install python3-venv python{PYTHON_VERSION}-venv python3-pip python3-dev git"
+)
+DNF_INSTALL_COMMANDS = (
+    "sudo dnf install python3-venv python3-pip python3-devel git",
+)
+PACMAN_INSTALL_COMMANDS = (
+    "sudo pacman -S python-pip git",
+)
+
+# os-release ID / ID_LIKE values mapped to their install commands
+DISTRO_INSTALL_COMMANDS = {
+    "ubuntu": APT_INSTALL_COMMANDS,
+    "debian": APT_INSTALL_COMMANDS,
+    "fedora": DNF_INSTALL_COMMANDS,
+    "centos": DNF_INSTALL_COMMANDS,
+    "rhel": DNF_INSTALL_COMMANDS,
+    "arch": PACMAN_INSTALL_COMMANDS,
+}
+
+GENERIC_LINUX_COMMANDS = (
+    "# Install Python development tools for your distribution",
+    "# Ubuntu/Debian: sudo apt install python3-venv python3-pip python3-dev git",
+    "# Fedora/CentOS: sudo dnf install python3-venv python3-pip python3-devel git",
+    "# Arch: sudo pacman -S python-pip git"
+)
+MACOS_COMMANDS = (
+    "# Install via Homebrew:",
+    "brew install python git",
+    "# Or install Python from python.org"
+)
+WINDOWS_COMMANDS = (
+    "# Install Python from:",
+    "# https://www.python.org/downloads/",
+    "# Or use Microsoft Store:",
+    "# ms-windows-store://pdp/?ProductId=9NRWMJP3717K",
+    "# Or use Chocolatey:",
+    "# choco install python git"
+)
+
+@functools.lru_cache(maxsize=1)
+def read_os_release() -> dict:
+    """Parse /etc/os-release once into a dict of KEY=VALUE entries (uppercase keys, lowercased values)"""
+    try:
+        with open("/etc/os-release", "r") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+    
+    return {
+        key: value.strip().strip('"\'').lower()
+        for key, value in (line.split("=", 1) for line in lines if "=" in line and not line.startswith("#"))
+    }
+
 def get_platform_install_commands() -> List[str]:
     """Get platform-specific installation commands"""
-    system = platform.system().lower()
-    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-    
-    if system == "linux":
-        # Detect Linux distribution
-        try:
-            with open("/etc/os-release", "r") as f:
-                os_release = f.read().lower()
-            
-            if "ubuntu" in os_release or "debian" in os_release:
-                return [
-                    "sudo apt update",
-                    f"sudo apt install python3-venv python{python_version}-venv python3-pip python3-dev git"
-                ]
-            elif "fedora" in os_release or "centos" in os_release or "rhel" in os_release:
-                return [
-                    "sudo dnf install python3-venv python3-pip python3-devel git"
-                ]
-            elif "arch" in os_release:
-                return [
-                    "sudo pacman -S python-pip git"
-                ]
-        except FileNotFoundError:
-            pass
-        
-        return [
-            "# Install Python development tools for your distribution",
-            "# Ubuntu/Debian: sudo apt install python3-venv python3-pip python3-dev git",
-            "# Fedora/CentOS: sudo dnf install python3-venv python3-pip python3-devel git",
-            "# Arch: sudo pacman -S python-pip git"
-        ]
-    
-    elif system == "darwin":  # macOS
-        return [
-            "# Install via Homebrew:",
-            "brew install python git",
-            "# Or install Python from python.org"
-        ]
-    
-    elif system == "windows":
-        return [
-            "# Install Python from:",
-            "# https://www.python.org/downloads/",
-            "# Or use Microsoft Store:",
-            "# ms-windows-store://pdp/?ProductId=9NRWMJP3717K",
-            "# Or use Chocolatey:",
-            "# choco install python git"
-        ]
+    if _IS_LINUX:
+        # Detect Linux distribution from ID, then its ID_LIKE parents
+        os_release = read_os_release()
+        for distro in [os_release.get("ID", "")] + os_release.get("ID_LIKE", "").split():
+            if distro in DISTRO_INSTALL_COMMANDS:
+                return list(DISTRO_INSTALL_COMMANDS[distro])
+        return list(GENERIC_LINUX_COMMANDS)
+    
+    elif _IS_DARWIN:  # macOS
+        return list(MACOS_COMMANDS)
+    
+    elif _IS_WINDOWS:
+        return list(WINDOWS_COMMANDS)
     
     return ["# Please install Python 3.8+ and pip for your platform"]
 
 def create_virtual_environment(venv_path: Path) -> bool:
     """Create virtual environment"""
+    import venv
+    
     try:
         print_colored("📦 Creating virtual environment...", Colors.CYAN)
-        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], 
-                      check=True, capture_output=True)
+        builder = venv.EnvBuilder(system_site_packages=False, symlinks=not _IS_WINDOWS, with_pip=True)
+        builder.create(str(venv_path))
         print_colored("✅ Virtual environment created", Colors.GREEN)
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print_colored(f"❌ Failed to create virtual environment: {e}", Colors.RED)
         return False
 
+@functools.lru_cache(maxsize=None)
 def get_venv_python(venv_path: Path) -> str:
     """Get the python executable path for the virtual environment"""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return str(venv_path / "Scripts" / "python.exe")
     else:
         return str(venv_path / "bin" / "python")
 
+def get_venv_site_packages(venv_path: Path) -> Path:
+    """Get the site-packages directory of the virtual environment"""
+    if _IS_WINDOWS:
+        return venv_path / "Lib" / "site-packages"
+    else:
+        return venv_path / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+
+def get_installed_distributions(venv_path: Path) -> set:
+    """Get the lowercased names of distributions with dist-info in the venv's site-packages"""
+    try:
+        with os.scandir(get_venv_site_packages(venv_path)) as entries:
+            return {entry.name.split("-")[0].lower() for entry in entries if entry.name.endswith(".dist-info")}
+    except FileNotFoundError:
+        return set()
+
+def is_prdy_installed(venv_path: Path) -> bool:
+    """Check the venv's site-packages for PRDY install metadata without running Python"""
+    site_packages = get_venv_site_packages(venv_path)
+    if not site_packages.is_dir():
+        return False
+    
+    if (site_packages / "prdy").is_dir() or (site_packages / "prdy.egg-link").exists():
+        return True
+    return any(site_packages.glob("prdy-*.dist-info"))
+
 def get_venv_pip(venv_path: Path) -> List[str]:
     """Get the pip command for the virtual environment"""
     python_exe = get_venv_python(venv_path)
     return [python_exe, "-m", "pip"]
 
-def install_requirements(venv_path: Path, requirements_file: Path) -> bool:
-    """Install requirements in virtual environment"""
-    if not requirements_file.exists():
-        print_colored("⚠️  requirements.txt not found, skipping dependency installation", Colors.YELLOW)
-        return True
-    
-    pip_cmd = get_venv_pip(venv_path)
-    
-    # First, check if dependencies are already installed
+def get_requirements_hash(requirements_file: Path) -> str:
+    """Hash requirements.txt contents"""
+    return hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+
+def get_package_hash(project_dir: Path) -> str:
+    """Hash the modification times of the files that define the PRDY package"""
+    digest = hashlib.sha256()
+    for name in ("pyproject.toml", "setup.py", "prdy/__init__.py"):
+        path = project_dir / name
+        if path.exists():
+            digest.update(f"{name}:{path.stat().st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+def read_marker(marker_file: Path) -> Optional[str]:
+    """Read a stored install marker, if any"""
     try:
-        result = subprocess.run(pip_cmd + ["list"], capture_output=True, text=True, timeout=30)
-        if "flet" in result.stdout and "click" in result.stdout:
-            print_colored("✅ Dependencies already installed", Colors.GREEN)
-            return True
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return marker_file.read_text().strip()
+    except OSError:
+        return None
+
+def write_marker(marker_file: Path, value: str):
+    """Record a successful install"""
+    try:
+        marker_file.write_text(value)
+    except OSError:
         pass
+
+# Skip pip's self-update check and prompts; prefer wheels over source builds
+PIP_INSTALL_FLAGS = ["--disable-pip-version-check", "--no-input", "--prefer-binary"]
+
+# stderr fragments indicating a download/index problem worth retrying uncached
+PIP_NETWORK_ERRORS = ("could not find a version", "network", "connection", "timed out")
+
+def stream_pip(command: List[str], timeout: int) -> Tuple[Optional[int], str]:
+    """Run pip, echoing its output as it arrives; returns (returncode or None on timeout, output)"""
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1)
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    output = []
+    try:
+        for line in process.stdout:
+            output.append(line)
+            print_colored(f"   {line.rstrip()}")
+        process.wait()
+    finally:
+        timer.cancel()
+    
+    return (None if timed_out.is_set() else process.returncode), "".join(output)
+
+def run_pip_install(pip_cmd: List[str], install_args: List[str], timeout: int) -> bool:
+    """Run a single pip install, retrying without the cache only on network errors"""
+    command = pip_cmd + ["install"] + install_args + PIP_INSTALL_FLAGS
     
-    # Try multiple installation strategies
-    strategies = [
-        pip_cmd + ["install", "-r", str(requirements_file)],
-        pip_cmd + ["install", "-r", str(requirements_file), "--user"],
-        pip_cmd + ["install", "-r", str(requirements_file), "--no-cache-dir"],
-    ]
-    
-    for i, strategy in enumerate(strategies):
-        try:
-            print_colored(f"📚 Installing dependencies (strategy {i+1}/{len(strategies)})...", Colors.CYAN)
-            result = subprocess.run(strategy, check=True, capture_output=True, text=True, timeout=300)
-            print_colored("✅ Dependencies installed successfully", Colors.GREEN)
-            return True
-        except subprocess.CalledProcessError as e:
-            print_colored(f"⚠️  Strategy {i+1} failed: {e}", Colors.YELLOW)
-            if i == len(strategies) - 1:  # Last strategy
-                print_colored(f"Error output: {e.stderr if hasattr(e, 'stderr') else 'No error details'}", Colors.RED)
-        except subprocess.TimeoutExpired:
-            print_colored(f"⚠️  Strategy {i+1} timed out", Colors.YELLOW)
-    
-    print_colored("❌ Failed to install dependencies with all strategies", Colors.RED)
-    return False
+    returncode, output = stream_pip(command, timeout)
+    if returncode == 0:
+        return True
+    if returncode is None:
+        print_colored("⚠️  pip install timed out", Colors.YELLOW)
+        return False
+    if not any(marker in output.lower() for marker in PIP_NETWORK_ERRORS):
+        return False
+    
+    print_colored("⚠️  Network error, retrying without pip cache...", Colors.YELLOW)
+    returncode, output = stream_pip(command + ["--no-cache-dir"], timeout)
+    if returncode is None:
+        print_colored("⚠️  pip install timed out", Colors.YELLOW)
+    return returncode == 0
 
-def install_prdy_package(venv_path: Path, project_dir: Path) -> bool:
-    """Install PRDY package in virtual environment"""
-    pip_cmd = get_venv_pip(venv_path)
+def install_project(venv_path: Path, project_dir: Path, requirements_file: Path) -> bool:
+    """Install requirements and the PRDY package in one pip invocation"""
+    has_requirements = requirements_file.exists()
+    if not has_requirements:
+        print_colored("⚠️  requirements.txt not found, installing PRDY package only", Colors.YELLOW)
+    
+    # Fast path: requirements and package metadata unchanged since the last successful install
+    marker_file = venv_path / ".prdy-install.hash"
+    install_hash = get_package_hash(project_dir)
+    if has_requirements:
+        install_hash = f"{get_requirements_hash(requirements_file)}:{install_hash}"
+    if read_marker(marker_file) == install_hash:
+        print_colored("✅ Dependencies and PRDY package already installed", Colors.GREEN)
+        return True
     
-    # First, check if PRDY is already installed
-    try:
-        python_exe = get_venv_python(venv_path)
-        result = subprocess.run([python_exe, "-c", "import prdy; print('PRDY already installed')"], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print_colored("✅ PRDY package already installed", Colors.GREEN)
-            return True
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        pass
+    # A changed marker means requirements or metadata moved, so only guess at an
+    # existing install when there is no requirements file to install from
+    if (not has_requirements
+            and {"flet", "click"}.issubset(get_installed_distributions(venv_path))
+            and is_prdy_installed(venv_path)):
+        print_colored("✅ Dependencies and PRDY package already installed", Colors.GREEN)
+        write_marker(marker_file, install_hash)
+        return True
     
-    strategies = [
-        pip_cmd + ["install", "-e", str(project_dir)],
-        pip_cmd + ["install", "-e", str(project_dir), "--user"],
-    ]
+    install_args = ["-e", str(project_dir)]
+    if has_requirements:
+        install_args += ["-r", str(requirements_file)]
     
-    for i, strategy in enumerate(strategies):
-        try:
-            print_colored(f"🎯 Installing PRDY package (strategy {i+1}/{len(strategies)})...", Colors.CYAN)
-            result = subprocess.run(strategy, check=True, capture_output=True, text=True, timeout=120)
-            print_colored("✅ PRDY package installed successfully", Colors.GREEN)
-            return True
-        except subprocess.CalledProcessError as e:
-            print_colored(f"⚠️  Strategy {i+1} failed: {e}", Colors.YELLOW)
-            if i == len(strategies) - 1:  # Last strategy
-                print_colored(f"Error output: {e.stderr if hasattr(e, 'stderr') else 'No error details'}", Colors.RED)
-        except subprocess.TimeoutExpired:
-            print_colored(f"⚠️  Strategy {i+1} timed out", Colors.YELLOW)
-    
-    print_colored("❌ Failed to install PRDY package with all strategies", Colors.RED)
+    print_colored("📚 Installing dependencies and PRDY package...", Colors.CYAN)
+    if run_pip_install(get_venv_pip(venv_path), install_args, timeout=420):
+        print_colored("✅ Dependencies and PRDY package installed successfully", Colors.GREEN)
+        write_marker(marker_file, install_hash)
+        return True
+    
+    print_colored("❌ Failed to install dependencies and PRDY package", Colors.RED)
     return False
 
 def validate_installation(venv_path: Path) -> bool:
     """Validate that PRDY is properly installed"""
+    # Install metadata in site-packages is enough; no interpreter needed
+    if is_prdy_installed(venv_path):
+        print_colored("✅ PRDY installation validated", Colors.GREEN)
+        return True
+    
     python_exe = get_venv_python(venv_path)
     
     try:
-        # Test import
+        # Fall back to a test import
         result = subprocess.run([python_exe, "-c", "import prdy; print('PRDY module imported successfully')"], 
                               capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
@@ -294,8 +398,8 @@ def validate_installation(venv_path: Path) -> bool:
     print_colored("⚠️  Validation failed, but attempting to continue...", Colors.YELLOW)
     return True  # Continue despite validation failure
 
-def launch_gui(venv_path: Path) -> bool:
-    """Launch the PRDY GUI"""
+def launch_gui(venv_path: Path, exec_replace: bool = False) -> bool:
+    """Launch the PRDY GUI, optionally replacing the launcher process with it"""
     python_exe = get_venv_python(venv_path)
     
     try:
@@ -321,13 +425,21 @@ def launch_gui(venv_path: Path) -> bool:
                 print_colored("❌ Alternative launch also failed", Colors.RED)
                 return False
         
+        # The launcher's work is done; let the GUI take over this process
+        if exec_replace:
+            print_colored("\n🎉 Handing off to the PRDY GUI...", Colors.GREEN)
+            print_colored("💡 Check your desktop for the PRDY application window", Colors.CYAN)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(python_exe, [python_exe, "-m", "prdy.gui"])
+        
         # Launch GUI in a way that doesn't block
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             process = subprocess.Popen([python_exe, "-m", "prdy.gui"], 
-                                     creationflags=subprocess.CREATE_NEW_CONSOLE,
+                                     creationflags=subprocess.CREATE_NEW_CONSOLE, close_fds=True,
                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         else:
-            process = subprocess.Popen([python_exe, "-m", "prdy.gui"],
+            process = subprocess.Popen([python_exe, "-m", "prdy.gui"], close_fds=True,
                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
         # Give it a moment to start
@@ -372,12 +484,17 @@ def main():
     if not check_venv_available():
         issues.append("Python venv module not available")
     
-    pip_available, pip_cmd = check_pip_available()
+    # pip and git probes spawn subprocesses; overlap their wait time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pip_future = executor.submit(check_pip_available)
+        git_future = executor.submit(check_git_available)  # Optional
+    
+    pip_available, pip_cmd = pip_future.result()
     if not pip_available:
         if not bootstrap_pip():
             issues.append("pip not available")
     
-    check_git_available()  # Optional
+    git_future.result()
     
     if issues:
         print_colored("\n❌ Prerequisites not met:", Colors.RED)
@@ -394,7 +511,7 @@ def main():
     print_colored("✅ All system checks passed\n", Colors.GREEN)
     
     # Setup virtual environment if needed
-    if not venv_path.exists() or not (venv_path / ("Scripts" if platform.system() == "Windows" else "bin")).exists():
+    if not venv_path.exists() or not (venv_path / ("Scripts" if _IS_WINDOWS else "bin")).exists():
         if venv_path.exists():
             print_colored("🔧 Removing corrupted virtual environment...", Colors.YELLOW)
             shutil.rmtree(venv_path)
@@ -405,18 +522,15 @@ def main():
         print_colored("✅ Virtual environment already exists", Colors.GREEN)
     
     # Install dependencies and package
-    if not install_requirements(venv_path, requirements_file):
-        return False
-    
-    if not install_prdy_package(venv_path, project_dir):
+    if not install_project(venv_path, project_dir, requirements_file):
         return False
     
     # Validate installation
     if not validate_installation(venv_path):
         return False
     
-    # Launch GUI
-    if not launch_gui(venv_path):
+    # Launch GUI; on Unix this replaces the launcher process and does not return
+    if not launch_gui(venv_path, exec_replace=not _IS_WINDOWS):
         return False
     
     print_colored("\n🎉 PRDY GUI is now running!", Colors.GREEN)
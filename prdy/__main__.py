@@ -5,20 +5,45 @@ Handles both GUI and CLI modes
 
 import sys
 import os
-import argparse
+import functools
 from pathlib import Path
 
-# Add current directory to path for relative imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Running this file directly (not via -m or the console script) needs the
+# project root on the path for the prdy imports
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from prdy.app_controller import ApplicationController
-from prdy.utils.logger import get_logger
+VERSION_TEXT = "PRDY 0.1.0"
 
-logger = get_logger("main")
+
+@functools.lru_cache(maxsize=1)
+def get_main_logger():
+    """Get the main logger, importing the logging setup on first use"""
+    from prdy.utils.logger import get_logger
+    return get_logger("main")
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_controller():
+    """Get the shared ApplicationController, constructing it on first use"""
+    from prdy.app_controller import ApplicationController
+    return ApplicationController()
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings_manager():
+    """Get the shared SettingsManager, reusing the controller's when one exists"""
+    if get_app_controller.cache_info().currsize:
+        return get_app_controller().settings_manager
+    
+    from prdy.utils.settings_manager import SettingsManager
+    return SettingsManager()
 
 
 def create_parser():
     """Create command line argument parser"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog='prdy',
         description='PRDY - AI-powered Product Requirements Document Generator',
@@ -61,7 +86,7 @@ Examples:
     parser.add_argument(
         '--version',
         action='version',
-        version='PRDY 0.1.0'
+        version=VERSION_TEXT
     )
     
     # Configuration options
@@ -85,13 +110,17 @@ Examples:
     return parser
 
 
+def check_mark(value) -> str:
+    """Render a boolean as a status mark"""
+    return '✅' if value else '❌'
+
+
 def check_system_status():
     """Check and display system status"""
     try:
         from prdy.utils.state_detector import StateDetector
-        from prdy.utils.settings_manager import SettingsManager
         
-        settings_manager = SettingsManager()
+        settings_manager = get_settings_manager()
         state_detector = StateDetector(settings_manager)
         
         print("🔍 Checking PRDY system status...\n")
@@ -99,80 +128,85 @@ def check_system_status():
         # Get comprehensive system state
         system_state = state_detector.get_complete_system_state()
         
+        out = []
+        
         # Display Python environment
         python_env = system_state.get('python_environment', {})
-        print(f"🐍 Python Environment:")
-        print(f"   Version: {python_env.get('version', 'Unknown')}")
-        print(f"   Compatible: {'✅' if python_env.get('version_compatible', False) else '❌'}")
-        print(f"   Virtual Environment: {'✅' if python_env.get('virtual_env', False) else '❌'}")
-        print()
+        out.append("🐍 Python Environment:")
+        out.append(f"   Version: {python_env.get('version', 'Unknown')}")
+        out.append(f"   Compatible: {check_mark(python_env.get('version_compatible', False))}")
+        out.append(f"   Virtual Environment: {check_mark(python_env.get('virtual_env', False))}")
+        out.append("")
         
         # Display dependencies
         deps = system_state.get('dependencies', {})
-        print(f"📦 Dependencies:")
-        print(f"   Installed: {len(deps.get('installed', []))}/{len(deps.get('required', []))}")
-        print(f"   All Required: {'✅' if deps.get('all_installed', False) else '❌'}")
+        out.append("📦 Dependencies:")
+        out.append(f"   Installed: {len(deps.get('installed', []))}/{len(deps.get('required', []))}")
+        out.append(f"   All Required: {check_mark(deps.get('all_installed', False))}")
         if deps.get('missing'):
-            print(f"   Missing: {', '.join(deps['missing'])}")
-        print()
+            out.append(f"   Missing: {', '.join(deps['missing'])}")
+        out.append("")
         
         # Display system tools
         tools = system_state.get('system_tools', {})
-        print(f"🔧 System Tools:")
+        out.append("🔧 System Tools:")
         for tool, info in tools.items():
             if tool != 'summary':
-                status = '✅' if info.get('available', False) else '❌'
+                status = check_mark(info.get('available', False))
                 version = f" ({info.get('version', 'unknown')})" if info.get('version') else ""
-                print(f"   {tool}: {status}{version}")
-        print()
+                out.append(f"   {tool}: {status}{version}")
+        out.append("")
         
         # Display AI providers
         ai = system_state.get('ai_providers', {})
-        print(f"🤖 AI Providers:")
+        out.append("🤖 AI Providers:")
         
         claude_code = ai.get('claude_code', {})
-        status = '✅' if claude_code.get('installed', False) else '❌'
+        status = check_mark(claude_code.get('installed', False))
         working = '🟢' if claude_code.get('working', False) else '🔴'
-        print(f"   Claude Code: {status} {working}")
+        out.append(f"   Claude Code: {status} {working}")
         
         ollama = ai.get('ollama', {})
-        status = '✅' if ollama.get('available', False) else '❌'
+        status = check_mark(ollama.get('available', False))
         running = '🟢' if ollama.get('running', False) else '🔴'
-        print(f"   Ollama: {status} {running}")
-        print()
+        out.append(f"   Ollama: {status} {running}")
+        out.append("")
         
         # Display database
         db = system_state.get('database', {})
-        print(f"💾 Database:")
-        print(f"   Initialized: {'✅' if db.get('initialized', False) else '❌'}")
-        print(f"   Connection: {'✅' if db.get('connection_working', False) else '❌'}")
+        out.append("💾 Database:")
+        out.append(f"   Initialized: {check_mark(db.get('initialized', False))}")
+        out.append(f"   Connection: {check_mark(db.get('connection_working', False))}")
         if db.get('session_count') is not None:
-            print(f"   Sessions: {db['session_count']}")
-        print()
+            out.append(f"   Sessions: {db['session_count']}")
+        out.append("")
         
         # Display bootstrap status
         bootstrap = system_state.get('bootstrap_status', {})
-        print(f"🚀 Bootstrap Status:")
-        print(f"   Ready: {'✅' if bootstrap.get('is_ready', False) else '❌'}")
+        out.append("🚀 Bootstrap Status:")
+        out.append(f"   Ready: {check_mark(bootstrap.get('is_ready', False))}")
         
         missing = bootstrap.get('missing_components', [])
         if missing:
-            print(f"   Missing: {', '.join(missing)}")
+            out.append(f"   Missing: {', '.join(missing)}")
         
         recommendations = bootstrap.get('recommendations', [])
         if recommendations:
-            print(f"\n💡 Recommendations:")
+            out.append("\n💡 Recommendations:")
             for rec in recommendations:
-                print(f"   • {rec}")
+                out.append(f"   • {rec}")
         
         # Overall status
         overall_status = "✅ READY" if bootstrap.get('is_ready', False) else "❌ NEEDS SETUP"
-        print(f"\n📊 Overall Status: {overall_status}")
+        out.append(f"\n📊 Overall Status: {overall_status}")
+        
+        # Emit the whole report in one write
+        sys.stdout.write("\n".join(out) + "\n")
         
         return bootstrap.get('is_ready', False)
         
     except Exception as e:
-        logger.error("System status check failed", exception=e)
+        get_main_logger().error("System status check failed", exception=e)
         print(f"❌ System status check failed: {e}")
         return False
 
@@ -182,7 +216,7 @@ def force_bootstrap():
     try:
         print("🚀 Starting PRDY bootstrap process...\n")
         
-        app_controller = ApplicationController()
+        app_controller = get_app_controller()
         
         # Disable auto-bootstrap setting temporarily
         original_setting = app_controller.settings_manager.settings.auto_bootstrap
@@ -203,13 +237,18 @@ def force_bootstrap():
             app_controller.settings_manager.update_setting('auto_bootstrap', original_setting)
             
     except Exception as e:
-        logger.error("Forced bootstrap failed", exception=e)
+        get_main_logger().error("Forced bootstrap failed", exception=e)
         print(f"❌ Bootstrap failed: {e}")
         return False
 
 
 def main():
     """Main entry point"""
+    # Answer a bare --version without building the parser
+    if sys.argv[1:] in (['--version'], ['-V']):
+        print(VERSION_TEXT)
+        return
+    
     parser = create_parser()
     args = parser.parse_args()
     
@@ -233,9 +272,11 @@ def main():
     else:
         mode = "gui"  # Default to GUI
     
+    logger = get_main_logger()
+    
     # Update settings if specified
     try:
-        app_controller = ApplicationController()
+        app_controller = get_app_controller()
         
         if args.no_auto_bootstrap:
             app_controller.settings_manager.update_setting('auto_bootstrap', False)
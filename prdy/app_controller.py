@@ -7,47 +7,156 @@ import sys
 import os
 import signal
 import atexit
+import functools
+import hashlib
+import importlib
+import platform
+import sched
+import shutil
+import sysconfig
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-import subprocess
 import json
+import logging
 
 from .utils.settings_manager import SettingsManager
-from .utils.state_detector import StateDetector
 from .utils.logger import get_logger
-from .utils.environment_manager import EnvironmentManager
-from .utils.ai_integration import AIIntegration
-from .models.database import init_database
 
 logger = get_logger("app_controller")
 
 
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access"""
+    
+    def __init__(self, name: str):
+        self._name = name
+    
+    def __getattr__(self, attr: str):
+        # import_module takes the import lock, so first use from several threads is safe
+        return getattr(importlib.import_module(self._name), attr)
+
+
+# Heavy subsystems (SQLAlchemy, provider environments) load on first use only
+ai_integration_module = LazyModule(f"{__package__}.utils.ai_integration")
+database = LazyModule(f"{__package__}.models.database")
+
+# Tools whose binaries feed the persisted system-state fingerprint
+FINGERPRINT_TOOLS = ('node', 'npm', 'git', 'ollama')
+
+# AI environment config written by EnvironmentManager (also from other processes)
+AI_ENVIRONMENT_DIR = Path.home() / '.prd-generator'
+
+# Slow-changing system state sections that are persisted between launches
+PERSISTED_STATE_SECTIONS = ('python_environment', 'dependencies', 'system_tools', 'database', 'permissions')
+
+# Sections re-probed on every launch, even when the persisted state is reused
+LIVE_STATE_PROBES = {
+    'ai_providers': '_check_ai_providers',
+    'environments': '_check_environments',
+    'network': '_check_network_connectivity',
+    'resources': '_check_system_resources',
+}
+
+# Pre-flight resource minimums
+MIN_DISK_BYTES = 100 << 20  # 100 MB
+MIN_MEMORY_BYTES = 256 << 20  # 256 MB
+
+
+@functools.lru_cache(maxsize=1)
+def get_psutil():
+    """Import psutil once, returning None if it is not installed"""
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
+
+
+@dataclass
+class AppInfo:
+    """Application information snapshot, updated in place"""
+    __slots__ = ('version', 'is_running', 'uptime', 'settings', 'performance',
+                 'background_tasks', 'process_count')
+    
+    version: str
+    is_running: bool
+    uptime: float
+    settings: Dict[str, Any]
+    performance: Dict[str, Any]
+    background_tasks: int
+    process_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for serialization"""
+        return asdict(self)
+
+
 class ApplicationController:
     """Main application controller"""
     
     def __init__(self):
         self.settings_manager = SettingsManager()
-        self.state_detector = StateDetector(self.settings_manager)
-        self.env_manager = EnvironmentManager()
-        self.ai_integration = AIIntegration()
         
         # Application state
         self.is_running = False
         self.cleanup_registered = False
+        self._shutdown_guard = threading.Lock()  # Held once shutdown has started
+        self._previous_signal_handlers = {}
         self.background_tasks = []
+        
+        # One-off background jobs share a small pool; pending futures are tracked until done
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='prdy-bg')
+        self._futures = set()
         self.process_registry = {}
         
+        # Bootstrap/state detection caching, invalidated by bumping the version
+        self._state_version = 0
+        self._bootstrap_cache = None
+        self._probe_cache = {}
+        
+        # Serializes check-and-set updates of the shared ai_provider setting
+        self._settings_lock = threading.Lock()
+        
+        # Background scheduling; setting the event wakes and stops the worker
+        self._shutdown_event = threading.Event()
+        self._scheduler = sched.scheduler(time.monotonic, self._shutdown_event.wait)
+        # Guards the shutdown check + enter() against the cancel loop on shutdown
+        self._scheduler_lock = threading.Lock()
+        
         # Performance monitoring
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
         self.performance_metrics = {}
+        self._metrics_updated_at = 0.0
+        self._last_metrics_hash = None
+        self._info = None
         
         logger.info("Application controller initialized")
     
+    @functools.cached_property
+    def state_detector(self):
+        """State detector, created on first use"""
+        from .utils.state_detector import StateDetector
+        return StateDetector(self.settings_manager)
+    
+    @functools.cached_property
+    def env_manager(self):
+        """Environment manager, created on first use"""
+        from .utils.environment_manager import EnvironmentManager
+        return EnvironmentManager()
+    
+    @functools.cached_property
+    def ai_integration(self):
+        """AI integration, created on first use"""
+        return ai_integration_module.AIIntegration()
+    
     def start_application(self, mode: str = "gui") -> bool:
         """Start the application in specified mode"""
-        logger.info(f"Starting PRD Generator in {mode} mode")
+        logger.info("Starting PRD Generator in %s mode", mode)
         
         try:
             # Register cleanup
@@ -83,7 +192,7 @@ class ApplicationController:
             elif mode == "cli":
                 return self._start_cli()
             else:
-                logger.error(f"Unknown mode: {mode}")
+                logger.error("Unknown mode: %s", mode)
                 return False
                 
         except Exception as e:
@@ -95,17 +204,31 @@ class ApplicationController:
         """Perform pre-flight system checks"""
         logger.debug("Performing pre-flight checks")
         
-        checks = {
-            'python_version': sys.version_info >= (3, 8),
-            'permissions': self._check_permissions(),
-            'disk_space': self._check_disk_space(),
-            'memory': self._check_memory(),
+        probes = {
+            'permissions': self._check_permissions,
+            'resources': self._check_resources,
         }
+        checks = {'python_version': sys.version_info >= (3, 8)}
+        results = {}
+        
+        # The probes are independent I/O; run them concurrently
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        futures = {executor.submit(probe): name for name, probe in probes.items()}
+        try:
+            for future in as_completed(futures, timeout=2.0):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            logger.warning("Pre-flight checks timed out, assuming OK: %s", [name for name in probes if name not in results])
+        finally:
+            executor.shutdown(wait=False)
+        
+        checks['permissions'] = results.get('permissions', True)
+        checks['disk_space'], checks['memory'] = results.get('resources', (True, True))
         
         failed_checks = [name for name, result in checks.items() if not result]
         
         if failed_checks:
-            logger.error(f"Pre-flight checks failed: {failed_checks}")
+            logger.error("Pre-flight checks failed: %s", failed_checks)
             return False
         
         logger.debug("Pre-flight checks passed")
@@ -114,62 +237,43 @@ class ApplicationController:
     def _check_permissions(self) -> bool:
         """Check if we have necessary permissions"""
         try:
-            app_dir = self.settings_manager.app_dir
-            
-            # Test write access
-            test_file = app_dir / 'permission_test.tmp'
-            test_file.write_text('test')
-            test_file.unlink()
-            
-            return True
+            return os.access(self.settings_manager.app_dir, os.W_OK)
         except Exception:
             return False
     
-    def _check_disk_space(self) -> bool:
-        """Check available disk space"""
+    def _check_resources(self) -> tuple:
+        """Check available disk space and memory, assuming OK for whatever can't be checked"""
         try:
-            import shutil
-            free_bytes = shutil.disk_usage(self.settings_manager.app_dir).free
-            required_bytes = 100 * 1024 * 1024  # 100 MB minimum
-            return free_bytes > required_bytes
+            disk_ok = shutil.disk_usage(self.settings_manager.app_dir).free > MIN_DISK_BYTES
         except Exception:
-            return True  # Assume OK if we can't check
-    
-    def _check_memory(self) -> bool:
-        """Check available memory"""
+            disk_ok = True
+        
+        psutil = get_psutil()
         try:
-            import psutil
-            available_mb = psutil.virtual_memory().available / (1024 * 1024)
-            return available_mb > 256  # 256 MB minimum
-        except ImportError:
-            return True  # Assume OK if psutil not available
+            memory_ok = psutil.virtual_memory().available > MIN_MEMORY_BYTES if psutil else True
         except Exception:
-            return True
+            memory_ok = True
+        
+        return disk_ok, memory_ok
     
     def _initialize_core_systems(self) -> bool:
         """Initialize core application systems"""
         logger.debug("Initializing core systems")
         
         try:
-            # Initialize database
+            # Initialize database; bootstrap detection checks it right after this
             db_url = self.settings_manager.get_database_url()
-            init_database(db_url)
+            database.init_database(db_url)
             logger.debug("Database initialized")
             
             # Set up logging level
             from .utils.logger import logger as main_logger
             main_logger.set_level(self.settings_manager.settings.log_level)
             
-            # Initialize AI integration if configured
+            # Configured AI provider setup stays off the startup path
             ai_provider = self.settings_manager.settings.ai_provider
             if ai_provider != "none":
-                try:
-                    if ai_provider == "claude-code":
-                        self.ai_integration.setup_ai_provider(AIIntegration.AIProvider.CLAUDE_CODE, auto_install=False)
-                    elif ai_provider == "ollama":
-                        self.ai_integration.setup_ai_provider(AIIntegration.AIProvider.OLLAMA, auto_install=False)
-                except Exception as e:
-                    logger.warning(f"AI provider setup failed: {e}")
+                self._submit_background(self._setup_configured_ai_provider, ai_provider)
             
             # Start background tasks
             self._start_background_tasks()
@@ -181,34 +285,153 @@ class ApplicationController:
             logger.error("Core system initialization failed", exception=e)
             return False
     
+    def _setup_configured_ai_provider(self, ai_provider: str):
+        """Set up the configured AI provider in the background"""
+        try:
+            AIProvider = ai_integration_module.AIProvider
+            if ai_provider == "claude-code":
+                self.ai_integration.setup_ai_provider(AIProvider.CLAUDE_CODE, auto_install=False)
+            elif ai_provider == "ollama":
+                self.ai_integration.setup_ai_provider(AIProvider.OLLAMA, auto_install=False)
+        except Exception as e:
+            logger.warning("AI provider setup failed: %s", e)
+    
+    def _invalidate_state(self):
+        """Invalidate cached bootstrap and probe results after the system changed"""
+        self._state_version += 1
+        try:
+            self._state_cache_file.unlink()
+        except OSError:
+            pass
+    
+    @property
+    def _state_cache_file(self) -> Path:
+        """Location of the persisted system state"""
+        return self.settings_manager.cache_dir / 'state_cache.json'
+    
+    def _get_state_fingerprint(self) -> str:
+        """Fingerprint the interpreter, installed packages, tools and database that system state depends on"""
+        def mtime(path) -> str:
+            try:
+                return str(os.stat(path).st_mtime_ns)
+            except (OSError, TypeError):
+                return '-'
+        
+        db_url = self.settings_manager.get_database_url()
+        parts = [
+            sys.version,
+            platform.platform(),
+            mtime(sys.executable),
+            mtime(sysconfig.get_paths()['purelib']),
+            mtime(Path(__file__).parent.parent / 'requirements.txt'),
+            db_url,
+            mtime(db_url[len('sqlite:///'):]) if db_url.startswith('sqlite:///') else '-',
+            mtime(AI_ENVIRONMENT_DIR / 'config.json'),
+            mtime(AI_ENVIRONMENT_DIR / 'environments'),
+        ]
+        parts.extend(mtime(shutil.which(tool)) for tool in FINGERPRINT_TOOLS)
+        return hashlib.sha1('\0'.join(parts).encode()).hexdigest()
+    
+    def _write_state_cache(self, fingerprint: str, system_state: Dict[str, Any]):
+        """Persist the slow-changing sections of system state for the next launch"""
+        try:
+            persisted = {section: system_state[section] for section in PERSISTED_STATE_SECTIONS}
+            payload = json.dumps({'fingerprint': fingerprint, 'system_state': persisted}, default=str)
+            tmp_file = self._state_cache_file.with_suffix('.json.tmp')
+            tmp_file.write_text(payload)
+            os.replace(tmp_file, self._state_cache_file)
+        except Exception as e:
+            logger.warning("Failed to persist system state: %s", e)
+    
+    def _get_system_state(self) -> Dict[str, Any]:
+        """Get system state, serving the persisted copy when nothing it depends on changed"""
+        fingerprint = self._get_state_fingerprint()
+        
+        try:
+            cached = json.loads(self._state_cache_file.read_text())
+        except (OSError, ValueError):
+            cached = None
+        
+        if cached and cached.get('fingerprint') == fingerprint:
+            # Serve the recorded state now and refresh the record in the background
+            version = self._state_version
+            
+            def refresh():
+                try:
+                    system_state = self.state_detector.get_complete_system_state()
+                    if self._state_version == version:
+                        self._write_state_cache(self._get_state_fingerprint(), system_state)
+                except Exception as e:
+                    logger.warning("Background system state refresh failed: %s", e)
+            
+            self._submit_background(refresh)
+            
+            # Provider liveness, network and resources change between launches; probe them now
+            system_state = dict(cached['system_state'])
+            system_state['timestamp'] = time.time()
+            for section, probe_name in LIVE_STATE_PROBES.items():
+                system_state[section] = getattr(self.state_detector, probe_name)()
+            system_state['bootstrap_status'] = self.state_detector._determine_bootstrap_status()
+            return system_state
+        
+        system_state = self.state_detector.get_complete_system_state()
+        self._write_state_cache(fingerprint, system_state)
+        return system_state
+    
+    def _get_probe(self, probe_name: str) -> Dict[str, Any]:
+        """Run a state detector probe, reusing its result until the state changes"""
+        cached = self._probe_cache.get(probe_name)
+        if cached is None or cached[0] != self._state_version:
+            cached = (self._state_version, getattr(self.state_detector, probe_name)())
+            self._probe_cache[probe_name] = cached
+        return cached[1]
+    
     def _check_bootstrap_status(self) -> Dict[str, Any]:
-        """Check if system is properly bootstrapped"""
+        """Check if system is properly bootstrapped, reusing a result from the last 5 seconds"""
+        cached = self._bootstrap_cache
+        if cached and cached[1] == self._state_version and time.monotonic() - cached[0] < 5.0:
+            return cached[2]
+        
+        version = self._state_version
+        result = self._detect_bootstrap_status()
+        self._bootstrap_cache = (time.monotonic(), version, result)
+        return result
+    
+    def _detect_bootstrap_status(self) -> Dict[str, Any]:
+        """Detect whether the system is properly bootstrapped"""
         logger.debug("Checking bootstrap status")
         
         try:
-            system_state = self.state_detector.get_complete_system_state()
-            bootstrap_status = system_state.get('bootstrap_status', {})
+            version = self._state_version
+            system_state = self._get_system_state()
+            deps = system_state.get('dependencies') or {}
+            tools = system_state.get('system_tools') or {}
+            db = system_state.get('database') or {}
+            perms = system_state.get('permissions') or {}
+            ai_status = system_state.get('ai_providers') or {}
+            self._probe_cache['_check_dependencies'] = (version, deps)
+            self._probe_cache['_check_system_tools'] = (version, tools)
+            
+            deps_installed = deps.get('all_installed', False)
+            db_initialized = db.get('initialized', False)
             
             # Determine if system is ready
-            is_ready = all([
-                system_state.get('dependencies', {}).get('all_installed', False),
-                system_state.get('database', {}).get('initialized', False),
-                system_state.get('permissions', {}).get('app_directory_writable', False)
-            ])
+            is_ready = bool(deps_installed and db_initialized and perms.get('app_directory_writable', False))
             
             missing_components = []
             recommendations = []
             
-            if not system_state.get('dependencies', {}).get('all_installed', False):
+            if not deps_installed:
                 missing_components.append('dependencies')
                 recommendations.append('Install missing Python dependencies')
             
-            if not system_state.get('database', {}).get('initialized', False):
+            if not db_initialized:
                 missing_components.append('database')
                 recommendations.append('Initialize application database')
             
-            ai_status = system_state.get('ai_providers', {})
-            if not ai_status.get('claude_code', {}).get('installed', False) and not ai_status.get('ollama', {}).get('available', False):
+            claude_code = ai_status.get('claude_code') or {}
+            ollama = ai_status.get('ollama') or {}
+            if not claude_code.get('installed', False) and not ollama.get('available', False):
                 missing_components.append('ai_providers')
                 recommendations.append('Set up at least one AI provider')
             
@@ -236,27 +459,36 @@ class ApplicationController:
             # Check what needs to be done
             bootstrap_status = self._check_bootstrap_status()
             missing = bootstrap_status.get('missing_components', [])
+            still_missing = set(missing)
             
             # Install dependencies if needed
             if 'dependencies' in missing:
                 logger.info("Installing dependencies")
                 if not self._install_dependencies():
                     return False
+                still_missing.discard('dependencies')
             
             # Initialize database if needed
             if 'database' in missing:
                 logger.info("Initializing database")
                 if not self._initialize_database():
                     return False
+                still_missing.discard('database')
             
             # Set up AI providers if needed
             if 'ai_providers' in missing:
                 logger.info("Setting up AI providers")
                 self._setup_ai_providers()  # Non-blocking
+                still_missing.discard('ai_providers')
+            
+            # Every step reported success, so only rescan when the first check itself failed
+            system_state = bootstrap_status.get('system_state')
+            if system_state is None:
+                is_ready = self._check_bootstrap_status()['is_ready']
+            else:
+                is_ready = not still_missing and system_state.get('permissions', {}).get('app_directory_writable', False)
             
-            # Update bootstrap status
-            final_status = self._check_bootstrap_status()
-            if final_status['is_ready']:
+            if is_ready:
                 logger.info("Auto-bootstrap completed successfully")
                 return True
             else:
@@ -270,23 +502,52 @@ class ApplicationController:
     def _install_dependencies(self) -> bool:
         """Install missing dependencies"""
         try:
-            deps_check = self.state_detector._check_dependencies()
+            deps_check = self._get_probe('_check_dependencies')
             missing = deps_check.get('missing', [])
             
+            if not missing:
+                return True
+            
+            # Another process may have installed them since the probe ran
+            from .utils.state_detector import get_installed_distributions, normalize_distribution_name
+            installed = get_installed_distributions()
+            missing = [dep for dep in missing if normalize_distribution_name(dep) not in installed]
             if not missing:
                 return True
             
             # Try to install using pip
             import subprocess
             
-            cmd = [sys.executable, '-m', 'pip', 'install'] + missing
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            cmd = [
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input', '--quiet',
+                '--no-warn-script-location', '--prefer-binary',
+                *missing
+            ]
+            env = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1', 'PYTHONDONTWRITEBYTECODE': '1'}
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       text=True, env=env)
+            
+            # Stream stderr so failures surface as pip reports them; kill pip if it hangs
+            timer = threading.Timer(300, process.kill)
+            timer.start()
+            errors = []
+            log_lines = logger.is_enabled_for(logging.DEBUG)
+            try:
+                for line in process.stderr:
+                    errors.append(line)
+                    if log_lines:
+                        logger.debug("pip: %s", line.rstrip())
+                process.wait()
+            finally:
+                timer.cancel()
             
-            if result.returncode == 0:
-                logger.info(f"Successfully installed dependencies: {missing}")
+            if process.returncode == 0:
+                logger.info("Successfully installed dependencies: %s", missing)
+                self._invalidate_state()
                 return True
             else:
-                logger.error(f"Failed to install dependencies: {result.stderr}")
+                logger.error("Failed to install dependencies: %s", ''.join(errors))
                 return False
                 
         except Exception as e:
@@ -297,13 +558,13 @@ class ApplicationController:
         """Initialize the database"""
         try:
             db_url = self.settings_manager.get_database_url()
-            init_database(db_url)
+            database.init_database(db_url)
+            self._invalidate_state()
             
             # Test database connection
-            from .models.database import get_db_sync
             from .models.prd import PRDSession
             
-            db = get_db_sync()
+            db = database.get_db_sync()
             try:
                 db.query(PRDSession).count()
                 logger.info("Database initialized and tested successfully")
@@ -318,81 +579,138 @@ class ApplicationController:
             logger.error("Database initialization failed", exception=e)
             return False
     
+    def _setup_claude_if_available(self, tools: Dict[str, Any]) -> bool:
+        """Set up Claude Code when Node.js and npm are available"""
+        if not (tools.get('node', {}).get('available', False) and tools.get('npm', {}).get('available', False)):
+            return False
+        
+        AIProvider = ai_integration_module.AIProvider
+        
+        logger.info("Setting up Claude Code environment")
+        try:
+            self.ai_integration.setup_ai_provider(AIProvider.CLAUDE_CODE)
+            with self._settings_lock:
+                self.settings_manager.update_setting('ai_provider', 'claude-code')
+            return True
+        except Exception as e:
+            logger.warning("Claude Code setup failed: %s", e)
+            return False
+    
+    def _setup_ollama_if_available(self, tools: Dict[str, Any]) -> bool:
+        """Set up Ollama when it is available"""
+        if not tools.get('ollama', {}).get('available', False):
+            return False
+        
+        AIProvider = ai_integration_module.AIProvider
+        
+        logger.info("Setting up Ollama environment")
+        try:
+            self.ai_integration.setup_ai_provider(AIProvider.OLLAMA)
+            with self._settings_lock:
+                if self.settings_manager.settings.ai_provider == 'none':
+                    self.settings_manager.update_setting('ai_provider', 'ollama')
+            return True
+        except Exception as e:
+            logger.warning("Ollama setup failed: %s", e)
+            return False
+    
     def _setup_ai_providers(self):
         """Set up AI providers (non-blocking)"""
         def setup_async():
             try:
                 # Check system capabilities
-                tools = self.state_detector._check_system_tools()
+                tools = self._get_probe('_check_system_tools')
                 
-                # Try Claude Code if Node.js available
-                if tools.get('node', {}).get('available', False) and tools.get('npm', {}).get('available', False):
-                    logger.info("Setting up Claude Code environment")
-                    try:
-                        self.ai_integration.setup_ai_provider(AIIntegration.AIProvider.CLAUDE_CODE)
-                        self.settings_manager.update_setting('ai_provider', 'claude-code')
-                    except Exception as e:
-                        logger.warning(f"Claude Code setup failed: {e}")
+                # Providers are independent; set them up side by side
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [
+                        pool.submit(self._setup_claude_if_available, tools),
+                        pool.submit(self._setup_ollama_if_available, tools)
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
                 
-                # Try Ollama if available
-                if tools.get('ollama', {}).get('available', False):
-                    logger.info("Setting up Ollama environment")
-                    try:
-                        self.ai_integration.setup_ai_provider(AIIntegration.AIProvider.OLLAMA)
-                        if self.settings_manager.settings.ai_provider == 'none':
-                            self.settings_manager.update_setting('ai_provider', 'ollama')
-                    except Exception as e:
-                        logger.warning(f"Ollama setup failed: {e}")
+                self._invalidate_state()
                         
             except Exception as e:
                 logger.error("AI provider setup failed", exception=e)
         
-        # Run in background thread
-        thread = threading.Thread(target=setup_async, daemon=True)
-        thread.start()
-        self.background_tasks.append(thread)
+        # Run in the background pool
+        self._submit_background(setup_async)
+    
+    def _submit_background(self, fn, *args):
+        """Run a one-off job on the shared background pool"""
+        try:
+            future = self._executor.submit(fn, *args)
+        except RuntimeError:
+            logger.debug("Skipping background job %s during shutdown", fn.__name__)
+            return None
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
     
     def _start_background_tasks(self):
-        """Start background maintenance tasks"""
+        """Start background maintenance tasks on a single scheduler thread"""
         
-        def maintenance_task():
-            """Periodic maintenance"""
-            while self.is_running:
+        def schedule(delay, task):
+            """Run task after delay, then keep rescheduling it until shutdown"""
+            def run():
+                if self._shutdown_event.is_set():
+                    return
                 try:
-                    # Clean up temp files every hour
-                    self.settings_manager.cleanup_temp_files()
-                    
-                    # Update performance metrics
-                    self._update_performance_metrics()
-                    
-                    # Sleep for 1 hour
-                    time.sleep(3600)
-                    
+                    next_delay = task()
                 except Exception as e:
-                    logger.error("Maintenance task error", exception=e)
+                    logger.error("Background task %s error", task.__name__, exception=e)
+                    next_delay = delay
+                schedule(next_delay or delay, task)
+            
+            with self._scheduler_lock:
+                if not self._shutdown_event.is_set():
+                    self._scheduler.enter(delay, 0, run)
+        
+        def maintenance_task():
+            """Periodic maintenance"""
+            # Clean up temp files every hour
+            self.settings_manager.cleanup_temp_files()
+            
+            # Update performance metrics
+            self._update_performance_metrics()
         
         def auto_save_task():
             """Auto-save user data"""
-            while self.is_running:
-                try:
-                    # Auto-save interval from settings
-                    interval = self.settings_manager.settings.auto_save_interval
-                    time.sleep(interval)
-                    
-                    # Trigger auto-save for active sessions
-                    # This would save any unsaved PRD work
-                    
-                except Exception as e:
-                    logger.error("Auto-save task error", exception=e)
+            # Trigger auto-save for active sessions
+            # This would save any unsaved PRD work
+            
+            # Auto-save interval from settings
+            return self.settings_manager.settings.auto_save_interval
+        
+        # Prime the CPU sampler so the first metrics update has a baseline
+        psutil = get_psutil()
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
         
-        # Start background threads
-        maintenance_thread = threading.Thread(target=maintenance_task, daemon=True)
-        auto_save_thread = threading.Thread(target=auto_save_task, daemon=True)
+        schedule(3600, maintenance_task)
+        schedule(self.settings_manager.settings.auto_save_interval, auto_save_task)
         
-        maintenance_thread.start()
-        auto_save_thread.start()
+        scheduler_thread = threading.Thread(target=self._scheduler.run, daemon=True)
+        scheduler_thread.start()
+        
+        self.background_tasks.append(scheduler_thread)
+    
+    def _stop_background_tasks(self):
+        """Drop scheduled and queued tasks and wake the scheduler thread so it exits"""
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            self._executor.shutdown(wait=False)  # cancel_futures needs Python 3.9+
         
-        self.background_tasks.extend([maintenance_thread, auto_save_thread])
+        with self._scheduler_lock:
+            self._shutdown_event.set()
+            for event in self._scheduler.queue:
+                try:
+                    self._scheduler.cancel(event)
+                except ValueError:
+                    pass  # Already ran
     
     def _start_gui(self) -> bool:
         """Start the GUI interface"""
@@ -429,9 +747,9 @@ class ApplicationController:
             logger.info("Cleanup signal received")
             self._graceful_shutdown()
         
-        # Register signal handlers
-        signal.signal(signal.SIGTERM, cleanup_handler)
-        signal.signal(signal.SIGINT, cleanup_handler)
+        # Register signal handlers, remembering the ones they replace
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self._previous_signal_handlers[signum] = signal.signal(signum, cleanup_handler)
         
         # Register atexit handler
         atexit.register(self._graceful_shutdown)
@@ -439,9 +757,27 @@ class ApplicationController:
         self.cleanup_registered = True
         logger.debug("Cleanup handlers registered")
     
+    def _restore_signal_handlers(self):
+        """Put back the signal handlers replaced by the cleanup handler"""
+        for signum, handler in self._previous_signal_handlers.items():
+            try:
+                signal.signal(signum, handler if handler is not None else signal.SIG_DFL)
+            except ValueError:
+                pass  # Not on the main thread
+        self._previous_signal_handlers.clear()
+    
+    def _begin_shutdown(self) -> bool:
+        """Claim the shutdown; only the first caller gets True"""
+        if not self._shutdown_guard.acquire(blocking=False):
+            return False
+        
+        # A signal arriving during cleanup must not re-enter it
+        self._restore_signal_handlers()
+        return True
+    
     def _graceful_shutdown(self):
         """Perform graceful shutdown"""
-        if not self.is_running:
+        if not self.is_running or not self._begin_shutdown():
             return
         
         logger.info("Starting graceful shutdown")
@@ -450,14 +786,13 @@ class ApplicationController:
         try:
             # Save current window size if GUI
             if hasattr(self, 'page') and self.page:
-                self.settings_manager.update_setting('window_width', self.page.window_width)
-                self.settings_manager.update_setting('window_height', self.page.window_height)
+                self.settings_manager.update_settings({
+                    'window_width': self.page.window_width,
+                    'window_height': self.page.window_height
+                })
             
             # Stop background tasks
-            for task in self.background_tasks:
-                if task.is_alive():
-                    # Tasks are daemon threads, they'll stop when main thread stops
-                    pass
+            self._stop_background_tasks()
             
             # Clean up temporary files
             self.settings_manager.cleanup_temp_files()
@@ -475,66 +810,131 @@ class ApplicationController:
     
     def _emergency_cleanup(self):
         """Emergency cleanup for unexpected failures"""
+        if not self._begin_shutdown():
+            return
+        
         logger.critical("Performing emergency cleanup")
         
         try:
             self.is_running = False
+            self._stop_background_tasks()
             self._cleanup_processes()
             self.settings_manager.cleanup_temp_files()
         except Exception as e:
             logger.critical("Emergency cleanup failed", exception=e)
     
+    def register_process(self, process_id: str, process):
+        """Track a spawned process until it exits; a reaper thread drops it from the registry"""
+        self.process_registry[process_id] = process
+        
+        def reap():
+            try:
+                process.wait()
+            finally:
+                if self.process_registry.get(process_id) is process:
+                    del self.process_registry[process_id]
+        
+        threading.Thread(target=reap, daemon=True).start()
+    
     def _cleanup_processes(self):
-        """Clean up spawned processes"""
-        for process_id, process in self.process_registry.items():
+        """Clean up spawned processes within a single shared timeout"""
+        import subprocess
+        
+        # Signal every running process first so they shut down in parallel
+        running = {}
+        for process_id, process in list(self.process_registry.items()):
             try:
                 if process.poll() is None:  # Process still running
                     process.terminate()
-                    process.wait(timeout=5)
+                    running[process_id] = process
+            except Exception as e:
+                logger.warning("Failed to cleanup process %s: %s", process_id, e)
+        
+        # Reap them against one deadline; later processes usually exited already
+        deadline = time.monotonic() + 5
+        survivors = {}
+        for process_id, process in running.items():
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
             except subprocess.TimeoutExpired:
+                survivors[process_id] = process
+            except Exception as e:
+                logger.warning("Failed to cleanup process %s: %s", process_id, e)
+        
+        for process_id, process in survivors.items():
+            try:
                 process.kill()
+                process.wait(timeout=1)
             except Exception as e:
-                logger.warning(f"Failed to cleanup process {process_id}: {e}")
+                logger.warning("Failed to cleanup process %s: %s", process_id, e)
     
     def _update_performance_metrics(self):
-        """Update performance metrics"""
+        """Update performance metrics, at most once a minute"""
+        now = time.monotonic()
+        if now - self._metrics_updated_at < 60:
+            return
+        self._metrics_updated_at = now
+        
         try:
-            import psutil
-            
-            self.performance_metrics.update({
-                'uptime': time.time() - self.start_time,
-                'memory_usage': psutil.virtual_memory().percent,
-                'cpu_usage': psutil.cpu_percent(),
-                'active_sessions': len(self.background_tasks),
+            metrics = {
+                'uptime': now - self._start_monotonic,
                 'timestamp': time.time()
-            })
+            }
+            
+            psutil = get_psutil()
+            if psutil is not None:
+                # cpu_percent(interval=None) reports usage since the previous sample
+                metrics.update({
+                    'memory_usage': psutil.virtual_memory().percent,
+                    'cpu_usage': psutil.cpu_percent(interval=None),
+                    'active_sessions': len(self.background_tasks) + len(self._futures)
+                })
+            
+            self.performance_metrics.update(metrics)
             
-        except ImportError:
-            # psutil not available
-            self.performance_metrics.update({
-                'uptime': time.time() - self.start_time,
-                'timestamp': time.time()
-            })
         except Exception as e:
-            logger.warning(f"Performance metrics update failed: {e}")
+            logger.warning("Performance metrics update failed: %s", e)
     
     def _save_performance_metrics(self):
         """Save performance metrics"""
         try:
+            try:
+                import orjson
+                payload = orjson.dumps(self.performance_metrics)
+            except ImportError:
+                payload = json.dumps(self.performance_metrics, separators=(',', ':')).encode()
+            
+            payload_hash = hash(payload)
+            if payload_hash == self._last_metrics_hash:
+                return
+            
+            # Write to a temp file and rename so a crash never leaves a partial file
             metrics_file = self.settings_manager.logs_dir / 'performance.json'
-            with open(metrics_file, 'w') as f:
-                json.dump(self.performance_metrics, f, indent=2)
+            tmp_file = metrics_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, metrics_file)
+            self._last_metrics_hash = payload_hash
         except Exception as e:
-            logger.warning(f"Failed to save performance metrics: {e}")
+            logger.warning("Failed to save performance metrics: %s", e)
     
-    def get_application_info(self) -> Dict[str, Any]:
+    def get_application_info(self) -> AppInfo:
         """Get comprehensive application information"""
-        return {
-            'version': '0.1.0',
-            'is_running': self.is_running,
-            'uptime': time.time() - self.start_time,
-            'settings': self.settings_manager.get_app_info(),
-            'performance': self.performance_metrics,
-            'background_tasks': len(self.background_tasks),
-            'process_registry': list(self.process_registry.keys())
-        }
\ No newline at end of file
+        if self._info is None:
+            self._info = AppInfo(
+                version='0.1.0',
+                is_running=self.is_running,
+                uptime=0.0,
+                settings={},
+                performance=self.performance_metrics,
+                background_tasks=0,
+                process_count=0
+            )
+        
+        # Refresh the cheap live fields
+        info = self._info
+        info.settings = self.settings_manager.get_app_info()
+        info.is_running = self.is_running
+        info.uptime = time.monotonic() - self._start_monotonic
+        info.background_tasks = len(self.background_tasks) + len(self._futures)
+        info.process_count = len(self.process_registry)
+        return info
\ No newline at end of file
@@ -3,159 +3,205 @@ Command Line Interface for PRDY
 """
 
 import click
-import questionary
 import subprocess
 import sys
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress
-from typing import Dict, Any, Optional
-from datetime import datetime
 
-from .models.database import init_database, get_db_sync
 from .models.prd import (
-    PRDSession, Task, ProductType, IndustryType, ComplexityLevel, 
-    PRDSessionCreate, PRDContent, TaskCreate, TaskStatus
+    ProductType, IndustryType, ComplexityLevel,
+    PRDSessionCreate, PRDContent, TaskStatus,
+    PRODUCT_TYPE_BY_VALUE, INDUSTRY_TYPE_BY_VALUE, COMPLEXITY_LEVEL_BY_VALUE
 )
-from .engines.question_engine import QuestionEngine, QuestionType
-from .utils.prd_service import PRDService
-from .utils.ai_integration import AIIntegration, AIProvider
-from .utils.environment_manager import EnvironmentManager
+
+if TYPE_CHECKING:
+    from .utils.prd_service import PRDService
 
 console = Console()
 
+PROGRESS_REFRESH_PER_SECOND = 8
+
+AI_BENCHMARK_CONCURRENCY = 2
+
+AI_TEST_DATA = {
+    "project_name": "Test Project",
+    "problem_statement": "Need to test AI integration",
+    "product_type": "web_app"
+}
+
+TASK_STATUS_EMOJI = {
+    TaskStatus.PENDING: "⏳",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETED: "✅",
+    TaskStatus.BLOCKED: "🚫"
+}
+
+# Display names offered by `new`, mapped to enum values
+PRODUCT_TYPE_MAP = {
+    "Landing Page": ProductType.LANDING_PAGE,
+    "Mobile App": ProductType.MOBILE_APP,
+    "Web Application": ProductType.WEB_APP,
+    "Desktop Application": ProductType.DESKTOP_APP,
+    "SaaS Platform": ProductType.SAAS_PLATFORM,
+    "Enterprise Software": ProductType.ENTERPRISE_SOFTWARE,
+    "E-commerce Site": ProductType.ECOMMERCE,
+    "FinTech Product": ProductType.FINTECH,
+    "HealthTech Product": ProductType.HEALTHTECH,
+    "Full Business/Startup": ProductType.FULL_BUSINESS
+}
+
+INDUSTRY_MAP = {
+    "General/Other": IndustryType.GENERAL,
+    "Finance": IndustryType.FINANCE,
+    "Healthcare": IndustryType.HEALTHCARE,
+    "Education": IndustryType.EDUCATION,
+    "Retail": IndustryType.RETAIL,
+    "Manufacturing": IndustryType.MANUFACTURING,
+    "Entertainment": IndustryType.ENTERTAINMENT,
+    "Logistics": IndustryType.LOGISTICS,
+    "Real Estate": IndustryType.REAL_ESTATE,
+    "Government": IndustryType.GOVERNMENT
+}
+
+COMPLEXITY_MAP = {
+    "Simple (1-2 weeks, basic features)": ComplexityLevel.SIMPLE,
+    "Moderate (2-8 weeks, standard features)": ComplexityLevel.MODERATE,
+    "Complex (2-6 months, advanced features)": ComplexityLevel.COMPLEX,
+    "Enterprise (6+ months, comprehensive system)": ComplexityLevel.ENTERPRISE
+}
+
 
 @click.group()
 @click.version_option(version="0.1.0")
 @click.pass_context
 def main(ctx):
     """PRDY - AI-powered Product Requirements Document Generator"""
-    # Initialize database
-    init_database()
-    
     # Set up context for app controller integration
     if ctx.obj is None:
         ctx.obj = {}
 
 
+def format_date(value) -> str:
+    """Format a datetime as YYYY-MM-DD"""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def format_datetime(value) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM"""
+    return f"{format_date(value)} {value.hour:02d}:{value.minute:02d}"
+
+
+def validate_integer(value: str):
+    """Validate questionary input as an integer"""
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return "Please enter a valid number"
+
+
+def get_prd_service() -> "PRDService":
+    """Get the PRD service shared by the current command invocation"""
+    from .utils.prd_service import PRDService
+    
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return PRDService()
+    
+    obj = ctx.find_root().ensure_object(dict)
+    if "prd_service" not in obj:
+        obj["prd_service"] = PRDService()
+    return obj["prd_service"]
+
+
+def ask_choice(message: str, mapping: Dict[str, Any]) -> Any:
+    """Prompt for one of a mapping's labels and return its value"""
+    import questionary
+    
+    return mapping[questionary.select(message, choices=[*mapping]).ask()]
+
+
+def label_for(mapping: Dict[str, Any], value: Any) -> str:
+    """Get the display label for a mapped value"""
+    return next(label for label, mapped in mapping.items() if mapped == value)
+
+
 @main.command()
-def new():
+@click.option('--product-type', type=click.Choice([t.value for t in ProductType]),
+              help='Product type; prompted for if omitted')
+@click.option('--industry', type=click.Choice([i.value for i in IndustryType]),
+              help='Industry; prompted for if omitted')
+@click.option('--complexity', type=click.Choice([c.value for c in ComplexityLevel]),
+              help='Complexity level; prompted for if omitted')
+@click.option('--name', 'project_name', help='Project name; prompted for if omitted')
+@click.option('--interview/--no-interview', default=None,
+              help='Start the interview right away instead of asking')
+def new(product_type, industry, complexity, project_name, interview):
     """Create a new PRD session"""
     console.print(Panel.fit("🚀 Welcome to PRDY", style="bold blue"))
     console.print("Let's create a comprehensive Product Requirements Document for your project.\n")
     
-    # Get basic project information
-    product_type = questionary.select(
-        "What type of product are you building?",
-        choices=[
-            "Landing Page",
-            "Mobile App", 
-            "Web Application",
-            "Desktop Application",
-            "SaaS Platform",
-            "Enterprise Software",
-            "E-commerce Site",
-            "FinTech Product",
-            "HealthTech Product",
-            "Full Business/Startup"
-        ]
-    ).ask()
-    
-    # Map display names to enum values
-    product_type_map = {
-        "Landing Page": ProductType.LANDING_PAGE,
-        "Mobile App": ProductType.MOBILE_APP,
-        "Web Application": ProductType.WEB_APP,
-        "Desktop Application": ProductType.DESKTOP_APP,
-        "SaaS Platform": ProductType.SAAS_PLATFORM,
-        "Enterprise Software": ProductType.ENTERPRISE_SOFTWARE,
-        "E-commerce Site": ProductType.ECOMMERCE,
-        "FinTech Product": ProductType.FINTECH,
-        "HealthTech Product": ProductType.HEALTHTECH,
-        "Full Business/Startup": ProductType.FULL_BUSINESS
-    }
-    
-    industry = questionary.select(
-        "What industry are you in?",
-        choices=[
-            "General/Other",
-            "Finance",
-            "Healthcare", 
-            "Education",
-            "Retail",
-            "Manufacturing",
-            "Entertainment",
-            "Logistics",
-            "Real Estate",
-            "Government"
-        ]
-    ).ask()
+    # Get basic project information, prompting only for what wasn't given
+    if product_type is None:
+        product_type = ask_choice("What type of product are you building?", PRODUCT_TYPE_MAP)
+    else:
+        product_type = PRODUCT_TYPE_BY_VALUE[product_type]
     
-    industry_map = {
-        "General/Other": IndustryType.GENERAL,
-        "Finance": IndustryType.FINANCE,
-        "Healthcare": IndustryType.HEALTHCARE,
-        "Education": IndustryType.EDUCATION,
-        "Retail": IndustryType.RETAIL,
-        "Manufacturing": IndustryType.MANUFACTURING,
-        "Entertainment": IndustryType.ENTERTAINMENT,
-        "Logistics": IndustryType.LOGISTICS,
-        "Real Estate": IndustryType.REAL_ESTATE,
-        "Government": IndustryType.GOVERNMENT
-    }
-    
-    complexity = questionary.select(
-        "What's the complexity level of your project?",
-        choices=[
-            "Simple (1-2 weeks, basic features)",
-            "Moderate (2-8 weeks, standard features)",
-            "Complex (2-6 months, advanced features)",
-            "Enterprise (6+ months, comprehensive system)"
-        ]
-    ).ask()
+    if industry is None:
+        industry = ask_choice("What industry are you in?", INDUSTRY_MAP)
+    else:
+        industry = INDUSTRY_TYPE_BY_VALUE[industry]
     
-    complexity_map = {
-        "Simple (1-2 weeks, basic features)": ComplexityLevel.SIMPLE,
-        "Moderate (2-8 weeks, standard features)": ComplexityLevel.MODERATE,
-        "Complex (2-6 months, advanced features)": ComplexityLevel.COMPLEX,
-        "Enterprise (6+ months, comprehensive system)": ComplexityLevel.ENTERPRISE
-    }
+    if complexity is None:
+        complexity = ask_choice("What's the complexity level of your project?", COMPLEXITY_MAP)
+    else:
+        complexity = COMPLEXITY_LEVEL_BY_VALUE[complexity]
     
-    project_name = questionary.text(
-        "What's the name of your project?",
-        validate=lambda x: len(x.strip()) > 0
-    ).ask()
+    if not project_name or not project_name.strip():
+        import questionary
+        
+        project_name = questionary.text(
+            "What's the name of your project?",
+            validate=lambda x: len(x.strip()) > 0
+        ).ask()
     
     # Create PRD session
     session_data = PRDSessionCreate(
         name=project_name,
-        product_type=product_type_map[product_type],
-        industry_type=industry_map[industry],
-        complexity_level=complexity_map[complexity]
+        product_type=product_type,
+        industry_type=industry,
+        complexity_level=complexity
     )
     
-    # Initialize PRD service
-    prd_service = PRDService()
+    prd_service = get_prd_service()
     session = prd_service.create_session(session_data)
     
     console.print(f"\n✅ Created new PRD session: {project_name}")
     console.print(f"📋 Session ID: {session.id}")
-    console.print(f"🎯 Product Type: {product_type}")
-    console.print(f"🏢 Industry: {industry}")
-    console.print(f"📊 Complexity: {complexity}")
+    console.print(f"🎯 Product Type: {label_for(PRODUCT_TYPE_MAP, product_type)}")
+    console.print(f"🏢 Industry: {label_for(INDUSTRY_MAP, industry)}")
+    console.print(f"📊 Complexity: {label_for(COMPLEXITY_MAP, complexity)}")
     
     # Start the interview process
-    if questionary.confirm("\nWould you like to start the PRD interview now?").ask():
+    if interview is None:
+        import questionary
+        
+        interview = questionary.confirm("\nWould you like to start the PRD interview now?").ask()
+    
+    if interview:
         conduct_interview(session.id)
 
 
 def conduct_interview(session_id: int):
     """Conduct the PRD interview for a session"""
-    prd_service = PRDService()
+    import questionary
+    from rich.progress import Progress
+    from .engines.question_engine import QuestionEngine, QuestionType
+    
+    prd_service = get_prd_service()
     session = prd_service.get_session(session_id)
     
     if not session:
@@ -167,10 +213,9 @@ def conduct_interview(session_id: int):
     # Initialize question engine
     question_engine = QuestionEngine()
     
-    # Convert string values back to enums
-    product_type = ProductType(session.product_type)
-    industry_type = IndustryType(session.industry_type)
-    complexity_level = ComplexityLevel(session.complexity_level)
+    product_type = session.product_type
+    industry_type = session.industry_type
+    complexity_level = session.complexity_level
     
     questions = question_engine.get_questions_for_product(
         product_type,
@@ -178,23 +223,19 @@ def conduct_interview(session_id: int):
         complexity_level
     )
     
+    dependency_index = question_engine.build_dependency_index(questions)
     answers = {}
     
-    with Progress() as progress:
+    # Cap redraws so prompts aren't competing with a repaint per answer
+    with Progress(console=console, refresh_per_second=PROGRESS_REFRESH_PER_SECOND, transient=True) as progress:
         task = progress.add_task("[green]Answering questions...", total=len(questions))
         
-        for question in questions:
-            # Filter questions based on dependencies
-            filtered_questions = question_engine.filter_questions_by_dependencies(
-                [question], answers
-            )
-            
-            if not filtered_questions:
+        for q in questions:
+            # Skip questions whose dependencies aren't satisfied
+            if not question_engine.dependencies_met(dependency_index.get(q.id, ()), answers):
                 progress.advance(task)
                 continue
             
-            q = filtered_questions[0]
-            
             # Display help text if available
             if q.help_text:
                 console.print(f"💡 {q.help_text}", style="dim")
@@ -226,16 +267,13 @@ def conduct_interview(session_id: int):
                 ).ask()
             
             elif q.type == QuestionType.INTEGER:
-                while True:
-                    try:
-                        answer = questionary.text(
-                            q.question,
-                            default=str(q.default) if q.default else ""
-                        ).ask()
-                        answer = int(answer)
-                        break
-                    except ValueError:
-                        console.print("❌ Please enter a valid number", style="red")
+                answer = questionary.text(
+                    q.question,
+                    default=str(q.default) if q.default else "",
+                    validate=validate_integer
+                ).ask()
+                if answer is not None:
+                    answer = int(answer)
             
             else:
                 answer = questionary.text(q.question).ask()
@@ -270,7 +308,9 @@ def generate(session_id):
 
 def generate_prd(session_id: int):
     """Generate PRD document for a session"""
-    prd_service = PRDService()
+    import questionary
+    
+    prd_service = get_prd_service()
     session = prd_service.get_session(session_id)
     
     if not session:
@@ -302,27 +342,29 @@ def generate_prd(session_id: int):
 
 def display_prd_summary(prd_content: PRDContent):
     """Display PRD summary in terminal"""
-    console.print(Panel.fit(f"📋 {prd_content.project_name}", style="bold blue"))
-    
-    # Executive Summary
-    console.print("\n[bold]Executive Summary[/bold]")
-    console.print(prd_content.executive_summary)
-    
-    # Problem Statement
-    console.print("\n[bold]Problem Statement[/bold]")
-    console.print(prd_content.problem_statement)
-    
-    # Features
-    if prd_content.features:
-        console.print("\n[bold]Key Features[/bold]")
-        for i, feature in enumerate(prd_content.features[:5], 1):
-            console.print(f"{i}. {feature.name}: {feature.description}")
-    
-    # Success Metrics
-    if prd_content.success_metrics:
-        console.print("\n[bold]Success Metrics[/bold]")
-        for metric in prd_content.success_metrics:
-            console.print(f"• {metric}")
+    # Buffer the whole summary into a single terminal write
+    with console:
+        console.print(Panel.fit(f"📋 {prd_content.project_name}", style="bold blue"))
+        
+        # Executive Summary
+        console.print("\n[bold]Executive Summary[/bold]")
+        console.print(prd_content.executive_summary)
+        
+        # Problem Statement
+        console.print("\n[bold]Problem Statement[/bold]")
+        console.print(prd_content.problem_statement)
+        
+        # Features
+        if prd_content.features:
+            console.print("\n[bold]Key Features[/bold]")
+            for i, feature in enumerate(prd_content.features[:5], 1):
+                console.print(f"{i}. {feature.name}: {feature.description}")
+        
+        # Success Metrics
+        if prd_content.success_metrics:
+            console.print("\n[bold]Success Metrics[/bold]")
+            for metric in prd_content.success_metrics:
+                console.print(f"• {metric}")
 
 
 @main.command()
@@ -335,7 +377,7 @@ def export(session_id, format):
 
 def export_prd(session_id: int, format: str):
     """Export PRD to file"""
-    prd_service = PRDService()
+    prd_service = get_prd_service()
     filename = prd_service.export_prd(session_id, format)
     
     if filename:
@@ -347,10 +389,14 @@ def export_prd(session_id: int, format: str):
 @main.command()
 def list():
     """List all PRD sessions"""
-    prd_service = PRDService()
-    sessions = prd_service.list_sessions()
+    from itertools import chain
+    from rich.table import Table
     
-    if not sessions:
+    prd_service = get_prd_service()
+    sessions = prd_service.iter_sessions()
+    
+    first_session = next(sessions, None)
+    if first_session is None:
         console.print("No PRD sessions found. Use 'prd new' to create one.", style="yellow")
         return
     
@@ -362,14 +408,15 @@ def list():
     table.add_column("Status", style="yellow")
     table.add_column("Created", style="dim")
     
-    for session in sessions:
+    # Sessions stream in batches instead of loading the whole result set
+    for session in chain((first_session,), sessions):
         table.add_row(
             str(session.id),
             session.name,
             session.product_type.replace('_', ' ').title(),
             session.industry_type.replace('_', ' ').title(),
             session.status,
-            session.created_at.strftime("%Y-%m-%d")
+            format_date(session.created_at)
         )
     
     console.print(table)
@@ -379,44 +426,42 @@ def list():
 @click.argument('session_id', type=int)
 def status(session_id):
     """Show status of a PRD session"""
-    prd_service = PRDService()
+    prd_service = get_prd_service()
     session = prd_service.get_session(session_id)
     
     if not session:
         console.print("❌ Session not found", style="red")
         return
     
-    # Display session info
-    console.print(Panel.fit(f"📊 Session Status: {session.name}", style="bold blue"))
-    console.print(f"🆔 ID: {session.id}")
-    console.print(f"🎯 Product Type: {session.product_type.replace('_', ' ').title()}")
-    console.print(f"🏢 Industry: {session.industry_type.replace('_', ' ').title()}")
-    console.print(f"📊 Complexity: {session.complexity_level.replace('_', ' ').title()}")
-    console.print(f"✅ Status: {session.status}")
-    console.print(f"📈 Completion: {session.completion_percentage}%")
-    console.print(f"📅 Created: {session.created_at.strftime('%Y-%m-%d %H:%M')}")
-    console.print(f"🔄 Updated: {session.updated_at.strftime('%Y-%m-%d %H:%M')}")
-    
-    # Show tasks if any
     tasks = prd_service.get_session_tasks(session_id)
-    if tasks:
-        console.print("\n[bold]Tasks:[/bold]")
-        for task in tasks:
-            status_emoji = {
-                TaskStatus.PENDING.value: "⏳",
-                TaskStatus.IN_PROGRESS.value: "🔄", 
-                TaskStatus.COMPLETED.value: "✅",
-                TaskStatus.BLOCKED.value: "🚫"
-            }.get(task.status, "❓")
-            
-            console.print(f"{status_emoji} {task.identifier}: {task.title}")
+    
+    # Buffer the whole report into a single terminal write
+    with console:
+        console.print(Panel.fit(f"📊 Session Status: {session.name}", style="bold blue"))
+        console.print(f"🆔 ID: {session.id}")
+        console.print(f"🎯 Product Type: {session.product_type.replace('_', ' ').title()}")
+        console.print(f"🏢 Industry: {session.industry_type.replace('_', ' ').title()}")
+        console.print(f"📊 Complexity: {session.complexity_level.replace('_', ' ').title()}")
+        console.print(f"✅ Status: {session.status}")
+        console.print(f"📈 Completion: {session.completion_percentage}%")
+        console.print(f"📅 Created: {format_datetime(session.created_at)}")
+        console.print(f"🔄 Updated: {format_datetime(session.updated_at)}")
+        
+        # Show tasks if any
+        if tasks:
+            console.print("\n[bold]Tasks:[/bold]")
+            for task in tasks:
+                status_emoji = TASK_STATUS_EMOJI.get(task.status, "❓")
+                console.print(f"{status_emoji} {task.identifier}: {task.title}")
 
 
 @main.command()
 @click.argument('session_id', type=int)
 def delete(session_id):
     """Delete a PRD session"""
-    prd_service = PRDService()
+    import questionary
+    
+    prd_service = get_prd_service()
     session = prd_service.get_session(session_id)
     
     if not session:
@@ -439,6 +484,8 @@ def ai():
 @ai.command()
 def status():
     """Show current AI provider status"""
+    from .utils.ai_integration import AIIntegration
+    
     ai_integration = AIIntegration()
     
     console.print(Panel.fit("🤖 AI Provider Status", style="bold blue"))
@@ -460,12 +507,16 @@ def status():
 
 
 @ai.command()
-def setup():
+@click.option('--refresh', is_flag=True, help='Re-detect system capabilities instead of using the cached result')
+def setup(refresh):
     """Set up AI environment (Claude Code or Ollama)"""
+    import questionary
+    from .utils.ai_integration import AIIntegration, AIProvider
+    
     console.print(Panel.fit("🤖 AI Environment Setup", style="bold blue"))
     
     ai_integration = AIIntegration()
-    capabilities = ai_integration.env_manager.detect_capabilities()
+    capabilities = ai_integration.env_manager.detect_capabilities(refresh=refresh)
     
     # Show system capabilities
     console.print("\n[bold]System Capabilities:[/bold]")
@@ -506,10 +557,13 @@ def setup():
 
 
 @ai.command()
-def status():
+@click.option('--refresh', is_flag=True, help='Re-detect system capabilities instead of using the cached result')
+def status(refresh):
     """Show AI provider status"""
+    from .utils.ai_integration import AIIntegration
+    
     ai_integration = AIIntegration()
-    status_info = ai_integration.get_provider_status()
+    status_info = ai_integration.get_provider_status(refresh_capabilities=refresh)
     
     console.print(Panel.fit("🤖 AI Provider Status", style="bold blue"))
     
@@ -532,6 +586,8 @@ def status():
 @click.argument('provider', type=click.Choice(['claude-code', 'ollama', 'none']))
 def switch(provider):
     """Switch AI provider"""
+    from .utils.ai_integration import AIIntegration, AIProvider
+    
     ai_integration = AIIntegration()
     
     if provider == 'none':
@@ -551,6 +607,8 @@ def switch(provider):
 @ai.command()
 def test():
     """Test current AI provider"""
+    from .utils.ai_integration import AIIntegration, AIProvider
+    
     ai_integration = AIIntegration()
     
     if ai_integration.current_provider == AIProvider.NONE:
@@ -560,14 +618,8 @@ def test():
     
     console.print(f"🧪 Testing {ai_integration.current_provider.value}...")
     
-    test_data = {
-        "project_name": "Test Project",
-        "problem_statement": "Need to test AI integration",
-        "product_type": "web_app"
-    }
-    
     with console.status("Running AI test..."):
-        response = ai_integration.analyze_prd_gaps(test_data)
+        response = ai_integration.analyze_prd_gaps(AI_TEST_DATA)
     
     if response.success:
         console.print("✅ AI provider working!", style="green")
@@ -587,9 +639,70 @@ def test():
             console.print("   prdy ai claude-test")
 
 
+@ai.command()
+@click.option('--runs', default=1, type=click.IntRange(min=1), help='Number of queries per provider')
+def benchmark(runs):
+    """Benchmark all configured AI providers concurrently"""
+    import asyncio
+    import time
+    from rich.table import Table
+    from .utils.ai_integration import AIIntegration, AIProvider
+    
+    environments = AIIntegration().env_manager.list_environments()
+    
+    if not environments:
+        console.print("❌ No AI providers configured", style="red")
+        console.print("💡 Run 'prdy ai setup' first to configure an AI provider", style="blue")
+        return
+    
+    async def ping_provider(env_name, env_config, semaphore):
+        ai_integration = AIIntegration()
+        if not ai_integration.switch_provider(AIProvider(env_config.ai_provider), env_name):
+            raise RuntimeError(f"Could not activate {env_name}")
+        
+        latencies = []
+        response = None
+        for _ in range(runs):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await ai_integration.analyze_prd_gaps_async(AI_TEST_DATA)
+                latencies.append(time.perf_counter() - started)
+        return response, latencies
+    
+    async def ping_all():
+        semaphore = asyncio.Semaphore(AI_BENCHMARK_CONCURRENCY)
+        return await asyncio.gather(
+            *(ping_provider(name, config, semaphore) for name, config in environments.items()),
+            return_exceptions=True
+        )
+    
+    with console.status(f"Benchmarking {len(environments)} provider(s)..."):
+        results = asyncio.run(ping_all())
+    
+    table = Table(title="AI Provider Benchmark")
+    table.add_column("Environment", style="cyan")
+    table.add_column("Provider", style="blue")
+    table.add_column("Result")
+    table.add_column("Mean Latency", justify="right")
+    
+    for (env_name, env_config), result in zip(environments.items(), results):
+        if isinstance(result, Exception):
+            table.add_row(env_name, env_config.ai_provider, f"❌ {result}", "-")
+            continue
+        
+        response, latencies = result
+        mean_latency = sum(latencies) / len(latencies)
+        outcome = "✅ OK" if response.success else "❌ Failed"
+        table.add_row(env_name, env_config.ai_provider, outcome, f"{mean_latency:.2f}s")
+    
+    console.print(table)
+
+
 @ai.command()
 def claude_info():
     """Show Claude Code environment information"""
+    from .utils.ai_integration import AIIntegration
+    
     ai_integration = AIIntegration()
     env_config = ai_integration.env_manager.get_environment("claude-code")
     
@@ -635,6 +748,8 @@ def claude_info():
 @ai.command()
 def claude_test():
     """Test Claude Code directly without PRDY integration"""
+    from .utils.ai_integration import AIIntegration
+    
     ai_integration = AIIntegration()
     env_config = ai_integration.env_manager.get_environment("claude-code")
     
@@ -697,6 +812,9 @@ def claude_test():
 @ai.command()
 def claude_login():
     """Help with Claude Code authentication"""
+    import questionary
+    from .utils.ai_integration import AIIntegration
+    
     ai_integration = AIIntegration()
     env_config = ai_integration.env_manager.get_environment("claude-code")
     
@@ -2,12 +2,46 @@
 Dynamic question engine that adapts questions based on product type, industry, and complexity
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import functools
+import itertools
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
 from enum import Enum
 from ..models.prd import ProductType, IndustryType, ComplexityLevel
 
 
+# Answer options per question, as shared tuples of interned strings
+CHOICES: Dict[str, Tuple[str, ...]] = {
+    name: tuple(sys.intern(option) for option in options)
+    for name, options in {
+        "timeline": ["2-4 weeks", "1-3 months", "3-6 months", "6-12 months", "12+ months"],
+        "business_model": ["Free", "One-time purchase", "Subscription", "Freemium", "Advertising", "Commission", "Other"],
+        "hosting_preference": ["Static hosting (Netlify/Vercel)", "WordPress", "Custom CMS", "No preference"],
+        "platforms": ["iOS", "Android", "Both"],
+        "native_vs_cross_platform": ["Native (separate iOS/Android apps)", "Cross-platform (React Native/Flutter)", "No preference"],
+        "device_features": ["Camera", "GPS/Location", "Microphone", "Accelerometer", "Biometric auth", "None"],
+        "expected_users": ["<100", "100-1000", "1000-10000", "10000+", "Unknown"],
+        "payment_methods": ["Credit/Debit Cards", "PayPal", "Apple Pay", "Google Pay", "Bank Transfer", "Cryptocurrency"],
+        "financial_data_types": ["Bank accounts", "Transactions", "Investments", "Credit scores", "Insurance", "Taxes"],
+        "regulatory_requirements": ["PCI DSS", "SOX", "KYC", "AML", "GDPR", "CCPA", "Other"],
+        "medical_data_types": ["Patient records", "Lab results", "Imaging", "Prescriptions", "Billing", "None"],
+        "financial_regulations": ["SOX", "PCI DSS", "FFIEC", "FINRA", "SEC", "Other"],
+        "budget_range": ["Under $10k", "$10k-$50k", "$50k-$100k", "$100k-$500k", "$500k+", "Prefer not to say"],
+        "maintenance_plan": ["Internal team", "External contractor", "Hybrid approach", "To be determined"]
+    }.items()
+}
+
+# Complexity levels that get the detailed business and project management sets
+DETAILED_COMPLEXITY_LEVELS = frozenset({ComplexityLevel.COMPLEX, ComplexityLevel.ENTERPRISE})
+
+# Shared fallback for categories with no questions for a product or industry
+NO_QUESTIONS: Tuple["Question", ...] = ()
+
+# Placeholder for answers not given yet; never equal to a dependency value
+UNANSWERED = object()
+
+
 class QuestionType(str, Enum):
     """Types of questions for different input methods"""
     TEXT = "text"
@@ -18,14 +52,13 @@ class QuestionType(str, Enum):
     FLOAT = "float"
 
 
-@dataclass
-class Question:
-    """Individual question definition"""
+class Question(NamedTuple):
+    """Individual question definition, immutable so instances can be shared"""
     id: str
     question: str
     type: QuestionType
     required: bool = True
-    choices: Optional[List[str]] = None
+    choices: Optional[Tuple[str, ...]] = None
     default: Any = None
     help_text: Optional[str] = None
     depends_on: Optional[Dict[str, Any]] = None  # Conditional logic
@@ -38,63 +71,81 @@ class QuestionEngine:
     def __init__(self):
         self.question_sets = self._initialize_question_sets()
     
-    def _initialize_question_sets(self) -> Dict[str, Dict[str, List[Question]]]:
-        """Initialize all question sets organized by category and product type"""
-        return {
-            "basic": self._get_basic_questions(),
-            "business": self._get_business_questions(),
-            "technical": self._get_technical_questions(),
-            "user_research": self._get_user_research_questions(),
-            "features": self._get_feature_questions(),
-            "compliance": self._get_compliance_questions(),
-            "project_management": self._get_project_management_questions()
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _initialize_question_sets(cls) -> Mapping[str, Mapping[str, Tuple[Question, ...]]]:
+        """Build all question sets organized by category and product type, once per process"""
+        # Shared by every engine instance, so expose read-only views only
+        question_sets = {
+            "basic": cls._get_basic_questions(),
+            "business": cls._get_business_questions(),
+            "technical": cls._get_technical_questions(),
+            "user_research": cls._get_user_research_questions(),
+            "features": cls._get_feature_questions(),
+            "compliance": cls._get_compliance_questions(),
+            "project_management": cls._get_project_management_questions()
         }
+        return MappingProxyType({
+            category: MappingProxyType(sets) for category, sets in question_sets.items()
+        })
     
     def get_questions_for_product(
         self, 
         product_type: ProductType, 
         industry: IndustryType = IndustryType.GENERAL,
         complexity: ComplexityLevel = ComplexityLevel.MODERATE
-    ) -> List[Question]:
-        """Get complete question set for a specific product configuration"""
+    ) -> Tuple[Question, ...]:
+        """Get complete question set for a specific product configuration (read-only)"""
+        return PRODUCT_QUESTIONS[(product_type, industry, complexity)]
+    
+    @classmethod
+    def _build_questions_for_product(
+        cls,
+        product_type: ProductType,
+        industry: IndustryType,
+        complexity: ComplexityLevel
+    ) -> Tuple[Question, ...]:
+        """Build the question set for a product configuration"""
+        question_sets = cls._initialize_question_sets()
         questions = []
         
         # Always include basic questions
-        questions.extend(self.question_sets["basic"]["all"])
+        questions.extend(question_sets["basic"]["all"])
         
         # Add business questions based on complexity
-        if complexity in [ComplexityLevel.COMPLEX, ComplexityLevel.ENTERPRISE]:
-            questions.extend(self.question_sets["business"]["detailed"])
+        if complexity in DETAILED_COMPLEXITY_LEVELS:
+            questions.extend(question_sets["business"]["detailed"])
         else:
-            questions.extend(self.question_sets["business"]["basic"])
+            questions.extend(question_sets["business"]["basic"])
         
         # Add technical questions based on product type
-        tech_questions = self.question_sets["technical"].get(product_type.value, [])
+        tech_questions = question_sets["technical"].get(product_type, NO_QUESTIONS)
         questions.extend(tech_questions)
         
         # Add user research questions
         if complexity != ComplexityLevel.SIMPLE:
-            questions.extend(self.question_sets["user_research"]["standard"])
+            questions.extend(question_sets["user_research"]["standard"])
         
         # Add feature questions based on product type
-        feature_questions = self.question_sets["features"].get(product_type.value, [])
+        feature_questions = question_sets["features"].get(product_type, NO_QUESTIONS)
         questions.extend(feature_questions)
         
         # Add industry-specific compliance questions
         if industry != IndustryType.GENERAL:
-            compliance_questions = self.question_sets["compliance"].get(industry.value, [])
+            compliance_questions = question_sets["compliance"].get(industry, NO_QUESTIONS)
             questions.extend(compliance_questions)
         
         # Add project management questions for complex projects
-        if complexity in [ComplexityLevel.COMPLEX, ComplexityLevel.ENTERPRISE]:
-            questions.extend(self.question_sets["project_management"]["detailed"])
+        if complexity in DETAILED_COMPLEXITY_LEVELS:
+            questions.extend(question_sets["project_management"]["detailed"])
         
-        return questions
+        return tuple(questions)
     
-    def _get_basic_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_basic_questions() -> Dict[str, Tuple[Question, ...]]:
         """Core questions for all products"""
         return {
-            "all": [
+            "all": (
                 Question(
                     id="project_name",
                     question="What is the name of your project?",
@@ -125,12 +176,13 @@ class QuestionEngine:
                     type=QuestionType.TEXT,
                     help_text="List the core features that deliver your value proposition"
                 )
-            ]
+            )
         }
     
-    def _get_business_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_business_questions() -> Dict[str, Tuple[Question, ...]]:
         """Business-focused questions"""
-        basic_questions = [
+        basic_questions = (
             Question(
                 id="success_metrics",
                 question="How will you measure success?",
@@ -141,16 +193,16 @@ class QuestionEngine:
                 id="timeline",
                 question="What is your target launch timeline?",
                 type=QuestionType.CHOICE,
-                choices=["2-4 weeks", "1-3 months", "3-6 months", "6-12 months", "12+ months"]
+                choices=CHOICES["timeline"]
             )
-        ]
+        )
         
-        detailed_questions = basic_questions + [
+        detailed_questions = basic_questions + (
             Question(
                 id="business_model",
                 question="What is your business model?",
                 type=QuestionType.CHOICE,
-                choices=["Free", "One-time purchase", "Subscription", "Freemium", "Advertising", "Commission", "Other"]
+                choices=CHOICES["business_model"]
             ),
             Question(
                 id="revenue_goals",
@@ -170,22 +222,23 @@ class QuestionEngine:
                 type=QuestionType.TEXT,
                 help_text="What makes you different from competitors?"
             )
-        ]
+        )
         
         return {
             "basic": basic_questions,
             "detailed": detailed_questions
         }
     
-    def _get_technical_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_technical_questions() -> Dict[str, Tuple[Question, ...]]:
         """Technical questions by product type"""
         return {
-            ProductType.LANDING_PAGE.value: [
+            ProductType.LANDING_PAGE: (
                 Question(
                     id="hosting_preference",
                     question="Do you have a hosting preference?",
                     type=QuestionType.CHOICE,
-                    choices=["Static hosting (Netlify/Vercel)", "WordPress", "Custom CMS", "No preference"],
+                    choices=CHOICES["hosting_preference"],
                     required=False
                 ),
                 Question(
@@ -195,20 +248,20 @@ class QuestionEngine:
                     required=False,
                     help_text="Brand colors, style preferences, existing brand guidelines"
                 )
-            ],
+            ),
             
-            ProductType.MOBILE_APP.value: [
+            ProductType.MOBILE_APP: (
                 Question(
                     id="platforms",
                     question="Which platforms do you want to support?",
                     type=QuestionType.MULTISELECT,
-                    choices=["iOS", "Android", "Both"]
+                    choices=CHOICES["platforms"]
                 ),
                 Question(
                     id="native_vs_cross_platform",
                     question="Do you prefer native or cross-platform development?",
                     type=QuestionType.CHOICE,
-                    choices=["Native (separate iOS/Android apps)", "Cross-platform (React Native/Flutter)", "No preference"]
+                    choices=CHOICES["native_vs_cross_platform"]
                 ),
                 Question(
                     id="offline_functionality",
@@ -224,12 +277,12 @@ class QuestionEngine:
                     id="device_features",
                     question="Which device features do you need?",
                     type=QuestionType.MULTISELECT,
-                    choices=["Camera", "GPS/Location", "Microphone", "Accelerometer", "Biometric auth", "None"],
+                    choices=CHOICES["device_features"],
                     required=False
                 )
-            ],
+            ),
             
-            ProductType.WEB_APP.value: [
+            ProductType.WEB_APP: (
                 Question(
                     id="user_authentication",
                     question="Do you need user accounts and authentication?",
@@ -252,7 +305,7 @@ class QuestionEngine:
                     id="expected_users",
                     question="How many users do you expect?",
                     type=QuestionType.CHOICE,
-                    choices=["<100", "100-1000", "1000-10000", "10000+", "Unknown"]
+                    choices=CHOICES["expected_users"]
                 ),
                 Question(
                     id="responsive_design",
@@ -260,9 +313,9 @@ class QuestionEngine:
                     type=QuestionType.CONFIRM,
                     default=True
                 )
-            ],
+            ),
             
-            ProductType.SAAS_PLATFORM.value: [
+            ProductType.SAAS_PLATFORM: (
                 Question(
                     id="multi_tenancy",
                     question="Do you need multi-tenant architecture?",
@@ -292,13 +345,14 @@ class QuestionEngine:
                     type=QuestionType.TEXT,
                     help_text="User behavior, feature usage, business metrics"
                 )
-            ]
+            )
         }
     
-    def _get_user_research_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_user_research_questions() -> Dict[str, Tuple[Question, ...]]:
         """User research and persona questions"""
         return {
-            "standard": [
+            "standard": (
                 Question(
                     id="primary_users",
                     question="Describe your primary user personas",
@@ -323,18 +377,19 @@ class QuestionEngine:
                     required=False,
                     depends_on={"user_research_done": True}
                 )
-            ]
+            )
         }
     
-    def _get_feature_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_feature_questions() -> Dict[str, Tuple[Question, ...]]:
         """Product-specific feature questions"""
         return {
-            ProductType.ECOMMERCE.value: [
+            ProductType.ECOMMERCE: (
                 Question(
                     id="payment_methods",
                     question="What payment methods do you want to support?",
                     type=QuestionType.MULTISELECT,
-                    choices=["Credit/Debit Cards", "PayPal", "Apple Pay", "Google Pay", "Bank Transfer", "Cryptocurrency"]
+                    choices=CHOICES["payment_methods"]
                 ),
                 Question(
                     id="inventory_management",
@@ -347,28 +402,29 @@ class QuestionEngine:
                     type=QuestionType.TEXT,
                     help_text="Standard, express, international, pickup, etc."
                 )
-            ],
+            ),
             
-            ProductType.FINTECH.value: [
+            ProductType.FINTECH: (
                 Question(
                     id="financial_data_types",
                     question="What types of financial data will you handle?",
                     type=QuestionType.MULTISELECT,
-                    choices=["Bank accounts", "Transactions", "Investments", "Credit scores", "Insurance", "Taxes"]
+                    choices=CHOICES["financial_data_types"]
                 ),
                 Question(
                     id="regulatory_requirements",
                     question="Which financial regulations must you comply with?",
                     type=QuestionType.MULTISELECT,
-                    choices=["PCI DSS", "SOX", "KYC", "AML", "GDPR", "CCPA", "Other"]
+                    choices=CHOICES["regulatory_requirements"]
                 )
-            ]
+            )
         }
     
-    def _get_compliance_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_compliance_questions() -> Dict[str, Tuple[Question, ...]]:
         """Industry-specific compliance questions"""
         return {
-            IndustryType.HEALTHCARE.value: [
+            IndustryType.HEALTHCARE: (
                 Question(
                     id="hipaa_compliance",
                     question="Do you need HIPAA compliance?",
@@ -379,16 +435,16 @@ class QuestionEngine:
                     id="medical_data_types",
                     question="What types of medical data will you handle?",
                     type=QuestionType.MULTISELECT,
-                    choices=["Patient records", "Lab results", "Imaging", "Prescriptions", "Billing", "None"]
+                    choices=CHOICES["medical_data_types"]
                 )
-            ],
+            ),
             
-            IndustryType.FINANCE.value: [
+            IndustryType.FINANCE: (
                 Question(
                     id="financial_regulations",
                     question="Which financial regulations apply?",
                     type=QuestionType.MULTISELECT,
-                    choices=["SOX", "PCI DSS", "FFIEC", "FINRA", "SEC", "Other"]
+                    choices=CHOICES["financial_regulations"]
                 ),
                 Question(
                     id="audit_requirements",
@@ -396,13 +452,14 @@ class QuestionEngine:
                     type=QuestionType.CONFIRM,
                     default=True
                 )
-            ]
+            )
         }
     
-    def _get_project_management_questions(self) -> Dict[str, List[Question]]:
+    @staticmethod
+    def _get_project_management_questions() -> Dict[str, Tuple[Question, ...]]:
         """Project management and team questions"""
         return {
-            "detailed": [
+            "detailed": (
                 Question(
                     id="team_size",
                     question="How large is your development team?",
@@ -413,7 +470,7 @@ class QuestionEngine:
                     id="budget_range",
                     question="What is your budget range?",
                     type=QuestionType.CHOICE,
-                    choices=["Under $10k", "$10k-$50k", "$50k-$100k", "$100k-$500k", "$500k+", "Prefer not to say"]
+                    choices=CHOICES["budget_range"]
                 ),
                 Question(
                     id="existing_systems",
@@ -426,32 +483,47 @@ class QuestionEngine:
                     id="maintenance_plan",
                     question="Who will maintain the system after launch?",
                     type=QuestionType.CHOICE,
-                    choices=["Internal team", "External contractor", "Hybrid approach", "To be determined"]
+                    choices=CHOICES["maintenance_plan"]
                 )
-            ]
+            )
         }
     
     def filter_questions_by_dependencies(
         self, 
-        questions: List[Question], 
+        questions: Sequence[Question], 
         answers: Dict[str, Any]
     ) -> List[Question]:
         """Filter questions based on dependency logic"""
-        filtered_questions = []
-        
-        for question in questions:
-            if question.depends_on is None:
-                filtered_questions.append(question)
-                continue
-            
-            # Check if dependencies are satisfied
-            dependencies_met = True
-            for dep_key, dep_value in question.depends_on.items():
-                if dep_key not in answers or answers[dep_key] != dep_value:
-                    dependencies_met = False
-                    break
-            
-            if dependencies_met:
-                filtered_questions.append(question)
-        
-        return filtered_questions
\ No newline at end of file
+        # Unconditional questions short-circuit before any answer lookups
+        return [
+            question for question in questions
+            if not question.depends_on
+            or all(answers.get(dep_key, UNANSWERED) == dep_value
+                   for dep_key, dep_value in question.depends_on.items())
+        ]
+    
+    def build_dependency_index(
+        self,
+        questions: Sequence[Question]
+    ) -> Dict[str, Tuple[Tuple[str, Any], ...]]:
+        """Map each conditional question ID to its (answer ID, required value) pairs"""
+        return {
+            question.id: tuple(question.depends_on.items())
+            for question in questions
+            if question.depends_on
+        }
+    
+    @staticmethod
+    def dependencies_met(dependencies, answers: Dict[str, Any]) -> bool:
+        """Check whether every dependency is satisfied by the given answers"""
+        return all(
+            answers.get(dep_key, UNANSWERED) == dep_value
+            for dep_key, dep_value in dependencies
+        )
+
+
+# Every product configuration's question list, assembled once at import
+PRODUCT_QUESTIONS: Dict[Tuple[ProductType, IndustryType, ComplexityLevel], Tuple[Question, ...]] = {
+    key: QuestionEngine._build_questions_for_product(*key)
+    for key in itertools.product(ProductType, IndustryType, ComplexityLevel)
+}
@@ -3,41 +3,64 @@ GUI Application for PRDY using Flet
 Cross-platform desktop interface
 """
 
-import flet as ft
+from __future__ import annotations
+
 import asyncio
+import sys
 import threading
-import time
-from typing import Dict, Any, Optional, List
-from pathlib import Path
-import json
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from .utils.settings_manager import SettingsManager, UserSettings
-from .utils.state_detector import StateDetector
+from .utils.settings_manager import SettingsManager
 from .utils.logger import get_logger
-from .utils.environment_manager import EnvironmentManager
-from .utils.ai_integration import AIIntegration, AIProvider
-from .utils.prd_service import PRDService
-from .engines.question_engine import QuestionEngine, QuestionType
-from .models.prd import ProductType, IndustryType, ComplexityLevel
+
+if TYPE_CHECKING:
+    import flet as ft
+    from .utils.state_detector import StateDetector
+    from .utils.environment_manager import EnvironmentManager
+    from .utils.ai_integration import AIIntegration
+    from .utils.prd_service import PRDService
 
 logger = get_logger("gui")
 
+# Page updates requested within this window are sent as a single render
+UPDATE_COALESCE_SECONDS = 0.05
+
+
+def import_flet():
+    """Import flet on first use and bind it as the module-level ``ft``"""
+    global ft
+    import flet as ft
+    return ft
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop when it's installed (not available on Windows)"""
+    if sys.platform == "win32":
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class PRDYGUI:
     """Main GUI application class"""
     
     def __init__(self):
         self.settings_manager = SettingsManager()
-        self.state_detector = StateDetector(self.settings_manager)
-        self.env_manager = EnvironmentManager()
-        self.ai_integration = AIIntegration()
-        self.prd_service = PRDService()
         
         # GUI state
         self.page: Optional[ft.Page] = None
         self.current_view = "home"
         self.system_state: Dict[str, Any] = {}
         self.bootstrap_in_progress = False
+        self._resize_timer: Optional[threading.Timer] = None
+        self._update_handle: Optional[asyncio.TimerHandle] = None
         
         # Components
         self.status_bar = None
@@ -47,12 +70,40 @@ class PRDYGUI:
         
         logger.info("PRDY GUI initialized")
     
+    @cached_property
+    def state_detector(self) -> StateDetector:
+        """System state detector, created on first use"""
+        from .utils.state_detector import StateDetector
+        return StateDetector(self.settings_manager)
+    
+    @cached_property
+    def env_manager(self) -> EnvironmentManager:
+        """Environment manager, created on first use"""
+        from .utils.environment_manager import EnvironmentManager
+        return EnvironmentManager()
+    
+    @cached_property
+    def ai_integration(self) -> AIIntegration:
+        """AI integration, created on first use"""
+        from .utils.ai_integration import AIIntegration
+        return AIIntegration()
+    
+    @cached_property
+    def prd_service(self) -> PRDService:
+        """PRD service, created on first use"""
+        from .utils.prd_service import PRDService
+        return PRDService()
+    
     def run(self):
         """Run the GUI application"""
+        if install_uvloop():
+            logger.info("Using uvloop event loop")
+        import_flet()
         ft.app(target=self.main, assets_dir="assets", view=ft.AppView.FLET_APP)
     
     async def main(self, page: ft.Page):
         """Main application entry point"""
+        import_flet()
         self.page = page
         
         # Configure page
@@ -62,6 +113,7 @@ class PRDYGUI:
         page.window_height = self.settings_manager.settings.window_height
         page.window_resizable = True
         page.padding = 0
+        page.on_resize = self._on_resize
         
         # Set up page layout
         await self._setup_page_layout()
@@ -75,6 +127,24 @@ class PRDYGUI:
         
         logger.info("GUI application started")
     
+    def _on_resize(self, e):
+        """Persist the window size once resizing has settled for 500ms"""
+        if self._resize_timer:
+            self._resize_timer.cancel()
+        self._resize_timer = threading.Timer(0.5, self._save_window_size)
+        self._resize_timer.daemon = True
+        self._resize_timer.start()
+    
+    def _save_window_size(self):
+        """Save the current window size in one settings write"""
+        try:
+            self.settings_manager.update_settings({
+                'window_width': int(self.page.window_width),
+                'window_height': int(self.page.window_height)
+            })
+        except Exception as e:
+            logger.warning(f"Failed to save window size: {e}")
+    
     async def _setup_page_layout(self):
         """Set up the main page layout"""
         # Status bar
@@ -153,16 +223,13 @@ class PRDYGUI:
         """Check and update system state"""
         self._update_status("Checking system state...")
         
-        # Run state detection in background
-        def check_state():
-            self.system_state = self.state_detector.get_complete_system_state()
-        
-        # Run in thread to avoid blocking UI
-        thread = threading.Thread(target=check_state)
-        thread.start()
-        thread.join(timeout=10)  # 10 second timeout
-        
-        if thread.is_alive():
+        # Run state detection off the event loop so the UI keeps responding
+        try:
+            self.system_state = await asyncio.wait_for(
+                self._run_blocking(self.state_detector.get_complete_system_state),
+                timeout=10
+            )
+        except asyncio.TimeoutError:
             logger.warning("System state check timed out")
             self._update_status("System state check timed out")
         else:
@@ -175,6 +242,11 @@ class PRDYGUI:
             else:
                 self._update_status("Ready")
     
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call in the default executor and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
     async def _show_welcome_dialog(self):
         """Show welcome dialog for first-time users"""
         def close_welcome(e):
@@ -259,41 +331,44 @@ class PRDYGUI:
     
     async def _run_bootstrap(self, progress_bar, status_text, log_text):
         """Run the bootstrap process"""
-        steps = [
-            ("Checking dependencies", self._bootstrap_check_dependencies),
-            ("Setting up AI environments", self._bootstrap_setup_ai),
-            ("Initializing database", self._bootstrap_init_database),
-            ("Configuring settings", self._bootstrap_configure_settings),
-            ("Validating setup", self._bootstrap_validate)
+        # Steps within a phase are independent and run concurrently
+        phases = [
+            [("Checking dependencies", self._bootstrap_check_dependencies)],
+            [("Setting up AI environments", self._bootstrap_setup_ai),
+             ("Initializing database", self._bootstrap_init_database)],
+            [("Configuring settings", self._bootstrap_configure_settings),
+             ("Validating setup", self._bootstrap_validate)]
         ]
         
-        for i, (step_name, step_func) in enumerate(steps):
-            progress = (i / len(steps))
-            progress_bar.value = progress
-            status_text.value = f"{step_name}..."
-            log_text.value = f"Step {i+1}/{len(steps)}: {step_name}"
-            self.page.update()
+        for i, phase in enumerate(phases):
+            step_names = [step_name for step_name, _ in phase]
+            progress_bar.value = i / len(phases)
+            status_text.value = f"{' & '.join(step_names)}..."
+            log_text.value = f"Phase {i+1}/{len(phases)}: {', '.join(step_names)}"
+            self._request_update()
+            
+            results = await asyncio.gather(
+                *(step_func() for _, step_func in phase),
+                return_exceptions=True
+            )
             
-            try:
-                success = await step_func()
-                if not success:
+            for step_name, result in zip(step_names, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Bootstrap step failed: {step_name}", exception=result)
+                    status_text.value = f"Error: {step_name}"
+                    log_text.value = f"Error in {step_name}: {str(result)}"
+                    self._request_update()
+                    return
+                if not result:
                     status_text.value = f"Failed: {step_name}"
                     log_text.value = f"Bootstrap failed at step: {step_name}"
-                    self.page.update()
+                    self._request_update()
                     return
-            except Exception as e:
-                logger.error(f"Bootstrap step failed: {step_name}", exception=e)
-                status_text.value = f"Error: {step_name}"
-                log_text.value = f"Error in {step_name}: {str(e)}"
-                self.page.update()
-                return
-            
-            await asyncio.sleep(0.5)  # Brief pause for UI updates
         
         progress_bar.value = 1.0
         status_text.value = "Setup completed successfully!"
         log_text.value = "Your system is ready to use."
-        self.page.update()
+        self._request_update()
         
         # Close dialog after 2 seconds
         await asyncio.sleep(2)
@@ -301,26 +376,30 @@ class PRDYGUI:
         self.bootstrap_in_progress = False
         self.page.update()
         
-        # Refresh system state
+        # Refresh system state from scratch
+        self.state_detector.clear_cache()
         await self._check_system_state()
     
     async def _bootstrap_check_dependencies(self) -> bool:
         """Bootstrap step: Check dependencies"""
-        deps = self.state_detector._check_dependencies()
+        deps = await self._run_blocking(self.state_detector.get_probe, '_check_dependencies')
         return deps['all_installed']
     
     async def _bootstrap_setup_ai(self) -> bool:
         """Bootstrap step: Set up AI environments"""
+        from .utils.ai_integration import AIProvider
+        
         try:
             # Try to set up Claude Code if Node.js is available
-            tools = self.state_detector._check_system_tools()
+            tools = await self._run_blocking(self.state_detector.get_probe, '_check_system_tools')
             if tools['node']['available'] and tools['npm']['available']:
-                self.ai_integration.setup_ai_provider(AIProvider.CLAUDE_CODE)
+                await self._run_blocking(self.ai_integration.setup_ai_provider, AIProvider.CLAUDE_CODE)
             
             # Try to set up Ollama if available
             if tools['ollama']['available']:
-                self.ai_integration.setup_ai_provider(AIProvider.OLLAMA)
+                await self._run_blocking(self.ai_integration.setup_ai_provider, AIProvider.OLLAMA)
             
+            self.state_detector.clear_cache('_check_ai_providers')
             return True
         except Exception as e:
             logger.error("AI setup failed", exception=e)
@@ -331,7 +410,8 @@ class PRDYGUI:
         try:
             from .models.database import init_database
             db_url = self.settings_manager.get_database_url()
-            init_database(db_url)
+            await self._run_blocking(init_database, db_url)
+            self.state_detector.clear_cache('_check_database')
             return True
         except Exception as e:
             logger.error("Database initialization failed", exception=e)
@@ -341,7 +421,7 @@ class PRDYGUI:
         """Bootstrap step: Configure settings"""
         try:
             # Set up default AI provider if available
-            ai_status = self.state_detector._check_ai_providers()
+            ai_status = await self._run_blocking(self.state_detector.get_probe, '_check_ai_providers')
             if ai_status['claude_code']['installed']:
                 self.settings_manager.update_setting('ai_provider', 'claude-code')
             elif ai_status['ollama']['available']:
@@ -355,7 +435,7 @@ class PRDYGUI:
     async def _bootstrap_validate(self) -> bool:
         """Bootstrap step: Validate setup"""
         try:
-            health = self.state_detector.quick_health_check()
+            health = await self._run_blocking(self.state_detector.quick_health_check)
             return all(health.values())
         except Exception as e:
             logger.error("Validation failed", exception=e)
@@ -366,6 +446,26 @@ class PRDYGUI:
         if self.status_bar and self.page:
             status_row = self.status_bar.content
             status_row.controls[0].value = message
+            self._request_update()
+    
+    def _request_update(self):
+        """Schedule a page update, coalescing bursts of requests into one render"""
+        if self._update_handle is not None:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a non-async Flet callback thread: update right away
+            self.page.update()
+            return
+        
+        self._update_handle = loop.call_later(UPDATE_COALESCE_SECONDS, self._flush_update)
+    
+    def _flush_update(self):
+        """Send the pending coalesced page update"""
+        self._update_handle = None
+        if self.page:
             self.page.update()
     
     async def _on_navigation_change(self, e):
@@ -2,12 +2,67 @@
 Database connection and session management
 """
 
+import json
 import os
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from .prd import Base
+from .prd import Base, TaskDependency
+
+QUERY_CACHE_SIZE = 1200
+
+# Applied to every new SQLite connection: WAL journaling with relaxed syncing,
+# in-memory temp tables, a 256MB mmap window and a ~64MB page cache
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-64000",
+    "foreign_keys=ON",
+)
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def migrate_task_dependencies(engine) -> None:
+    """Move legacy JSON task dependencies into the task_dependencies table"""
+    columns = {column["name"] for column in inspect(engine).get_columns("tasks")}
+    if "dependencies" not in columns:
+        return
+    
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text("SELECT id, dependencies FROM tasks WHERE dependencies IS NOT NULL")
+        ).all()
+        if not rows:
+            return
+        
+        # Older rows stored task identifiers (PRD-001-001); accept raw ids too
+        ids_by_identifier = dict(conn.execute(text("SELECT identifier, id FROM tasks")).all())
+        existing = set(conn.execute(text("SELECT task_id, depends_on_id FROM task_dependencies")).all())
+        links = []
+        for task_id, raw in rows:
+            deps = json.loads(raw) if isinstance(raw, str) else raw
+            for dep in deps or ():
+                depends_on_id = dep if isinstance(dep, int) else ids_by_identifier.get(dep)
+                if depends_on_id is not None and (task_id, depends_on_id) not in existing:
+                    existing.add((task_id, depends_on_id))
+                    links.append({"task_id": task_id, "depends_on_id": depends_on_id})
+        
+        if links:
+            conn.execute(TaskDependency.__table__.insert(), links)
+        conn.execute(text("UPDATE tasks SET dependencies = NULL"))
 
 
 class DatabaseManager:
@@ -23,14 +78,22 @@ class DatabaseManager:
         
         # Create engine with appropriate configuration
         if database_url.startswith("sqlite"):
+            # An in-memory database only exists on its one connection, so share it
+            # across threads; file databases get a connection per checkout from the
+            # default QueuePool, which SQLAlchemy already opens with check_same_thread off
+            in_memory = make_url(database_url).database in (None, "", ":memory:")
+            pool_args = {}
+            if in_memory:
+                pool_args = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
             self.engine = create_engine(
                 database_url,
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
-                echo=False  # Set to True for SQL debugging
+                query_cache_size=QUERY_CACHE_SIZE,
+                echo=False,  # Set to True for SQL debugging
+                **pool_args
             )
+            event.listen(self.engine, "connect", apply_sqlite_pragmas)
         else:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = create_engine(database_url, query_cache_size=QUERY_CACHE_SIZE, echo=False)
         
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
@@ -38,8 +101,12 @@ class DatabaseManager:
         self.create_tables()
     
     def create_tables(self) -> None:
-        """Create all database tables"""
+        """Create all database tables, adding any indexes missing from older databases"""
         Base.metadata.create_all(bind=self.engine)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+        migrate_task_dependencies(self.engine)
     
     def get_session(self) -> Generator[Session, None, None]:
         """Get database session with automatic cleanup"""
@@ -6,7 +6,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -66,6 +68,22 @@ class TaskDifficulty(str, Enum):
     EXPERT = "expert"
 
 
+# Value-to-member lookups for strings read back from the database
+PRODUCT_TYPE_BY_VALUE = {member.value: member for member in ProductType}
+INDUSTRY_TYPE_BY_VALUE = {member.value: member for member in IndustryType}
+COMPLEXITY_LEVEL_BY_VALUE = {member.value: member for member in ComplexityLevel}
+
+
+def enum_column(enum_class: type) -> SAEnum:
+    """String column type that stores enum values and loads them back as members"""
+    return SAEnum(
+        enum_class,
+        native_enum=False,
+        length=50,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
 # SQLAlchemy Models
 class PRDSession(Base):
     """Database model for PRD generation sessions"""
@@ -73,37 +91,46 @@ class PRDSession(Base):
     
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
-    product_type = Column(String(50), nullable=False)
-    industry_type = Column(String(50), nullable=False)
-    complexity_level = Column(String(50), nullable=False)
+    product_type = Column(enum_column(ProductType), nullable=False)
+    industry_type = Column(enum_column(IndustryType), nullable=False)
+    complexity_level = Column(enum_column(ComplexityLevel), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    status = Column(String(50), default="in_progress")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    status = Column(String(50), default="in_progress", index=True)
     completion_percentage = Column(Integer, default=0)
-    data = Column(JSON)  # Stores the actual PRD content
+    data = Column(JSON().with_variant(JSONB(), "postgresql"))  # Stores the actual PRD content
     
     # Relationships
     tasks = relationship("Task", back_populates="session")
 
 
+class TaskDependency(Base):
+    """Association row linking a task to a task it depends on"""
+    __tablename__ = "task_dependencies"
+    
+    task_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True, index=True)
+    depends_on_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True, index=True)
+
+
 class Task(Base):
     """Database model for task tracking"""
     __tablename__ = "tasks"
+    # Leading session_id column also serves plain per-session lookups
+    __table_args__ = (Index("ix_tasks_session_status", "session_id", "status"),)
     
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("prd_sessions.id"))
-    parent_task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
+    parent_task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True, index=True)
     
     identifier = Column(String(50), unique=True, nullable=False)  # e.g., PRD-001
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    status = Column(String(50), default=TaskStatus.PENDING.value)
-    difficulty = Column(String(50), default=TaskDifficulty.MEDIUM.value)
+    status = Column(enum_column(TaskStatus), default=TaskStatus.PENDING, index=True)
+    difficulty = Column(enum_column(TaskDifficulty), default=TaskDifficulty.MEDIUM)
     priority = Column(String(50), default="medium")
     
     estimated_hours = Column(Integer)
     actual_hours = Column(Integer)
-    dependencies = Column(JSON)  # List of task IDs this depends on
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -112,6 +139,18 @@ class Task(Base):
     # Relationships
     session = relationship("PRDSession", back_populates="tasks")
     subtasks = relationship("Task", backref="parent_task", remote_side=[id])
+    dependencies = relationship(
+        "Task",
+        secondary="task_dependencies",
+        primaryjoin="Task.id == TaskDependency.task_id",
+        secondaryjoin="Task.id == TaskDependency.depends_on_id",
+    )
+    
+    @classmethod
+    def bulk_create(cls, session, rows: List[Dict[str, Any]]) -> None:
+        """Insert task rows in one executemany, bypassing the ORM unit of work"""
+        if rows:
+            session.execute(cls.__table__.insert(), rows)
 
 
 # Pydantic Models for API/Validation
@@ -3,6 +3,7 @@ AI Integration layer for PRD Generator
 Supports both Claude Code and Ollama providers
 """
 
+import asyncio
 import json
 import os
 from typing import Dict, List, Any, Optional
@@ -108,6 +109,11 @@ class AIIntegration:
             provider=str(self.current_provider)
         )
     
+    async def analyze_prd_gaps_async(self, session_data: Dict[str, Any]) -> AIResponse:
+        """Analyze PRD gaps without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_prd_gaps, session_data)
+    
     def enhance_prd_content(self, prd_content: Dict[str, Any]) -> AIResponse:
         """Enhance existing PRD content with AI suggestions"""
         if self.current_provider == AIProvider.NONE:
@@ -290,10 +296,10 @@ Format as a structured list with measurable criteria for each requirement.
                 metadata={"error": str(e)}
             )
     
-    def get_provider_status(self) -> Dict[str, Any]:
+    def get_provider_status(self, refresh_capabilities: bool = False) -> Dict[str, Any]:
         """Get current AI provider status"""
         environments = self.env_manager.list_environments()
-        capabilities = self.env_manager.detect_capabilities()
+        capabilities = self.env_manager.detect_capabilities(refresh=refresh_capabilities)
         
         return {
             "current_provider": self.current_provider.value,
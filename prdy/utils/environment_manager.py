@@ -9,6 +9,8 @@ import subprocess
 import shutil
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -19,6 +21,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Serializes read-modify-write of config.json between providers set up in parallel
+CONFIG_LOCK = threading.Lock()
+
 
 @dataclass
 class EnvironmentConfig:
@@ -38,13 +43,49 @@ class EnvironmentManager:
         self.base_path = Path(base_path or os.path.expanduser("~/.prd-generator"))
         self.environments_path = self.base_path / "environments"
         self.config_path = self.base_path / "config.json"
+        self.capabilities_path = self.base_path / "capabilities.json"
+        self.capabilities_ttl = 300  # 5 minutes
+        self._capabilities: Optional[Dict[str, Any]] = None
         
         # Ensure directories exist
         self.base_path.mkdir(exist_ok=True)
         self.environments_path.mkdir(exist_ok=True)
     
-    def detect_capabilities(self) -> Dict[str, bool]:
-        """Detect what AI capabilities are available on the system"""
+    def detect_capabilities(self, refresh: bool = False) -> Dict[str, bool]:
+        """Detect what AI capabilities are available, reusing a recent result"""
+        if not refresh:
+            if self._capabilities is None:
+                self._capabilities = self._load_cached_capabilities()
+            if self._capabilities is not None:
+                return dict(self._capabilities)
+        
+        capabilities = self._probe_capabilities()
+        self._capabilities = capabilities
+        self._save_cached_capabilities(capabilities)
+        return dict(capabilities)
+    
+    def _load_cached_capabilities(self) -> Optional[Dict[str, Any]]:
+        """Load capabilities cached on disk if still fresh"""
+        try:
+            if time.time() - self.capabilities_path.stat().st_mtime > self.capabilities_ttl:
+                return None
+            with open(self.capabilities_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def _save_cached_capabilities(self, capabilities: Dict[str, Any]):
+        """Persist capabilities so later commands can skip probing"""
+        temp_path = self.capabilities_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(capabilities, f)
+            os.replace(temp_path, self.capabilities_path)
+        except OSError:
+            pass
+    
+    def _probe_capabilities(self) -> Dict[str, Any]:
+        """Probe the system for AI tooling"""
         capabilities = {
             "node_js": shutil.which("node") is not None,
             "npm": shutil.which("npm") is not None,
@@ -88,7 +129,7 @@ class EnvironmentManager:
             
             # Check prerequisites
             task = progress.add_task("Checking prerequisites...", total=None)
-            capabilities = self.detect_capabilities()
+            capabilities = self.detect_capabilities(refresh=True)
             
             if not capabilities["node_js"] or not capabilities["npm"]:
                 console.print("❌ Node.js and npm are required for Claude Code", style="red")
@@ -146,7 +187,7 @@ class EnvironmentManager:
     
     def setup_ollama_environment(self, environment_name: str = "ollama") -> bool:
         """Set up Ollama environment"""
-        capabilities = self.detect_capabilities()
+        capabilities = self.detect_capabilities(refresh=True)
         
         if not capabilities["ollama"]:
             console.print("❌ Ollama not found. Please install Ollama first.", style="red")
@@ -200,18 +241,28 @@ node_modules\\.bin\\claude.cmd %*
     
     def _save_environment_config(self, env_name: str, config: EnvironmentConfig):
         """Save environment configuration"""
-        configs = self._load_all_configs()
-        configs[env_name] = {
-            "ai_provider": config.ai_provider,
-            "environment_path": config.environment_path,
-            "node_version": config.node_version,
-            "claude_code_version": config.claude_code_version,
-            "ollama_model": config.ollama_model,
-            "ollama_url": config.ollama_url
-        }
-        
-        with open(self.config_path, "w") as f:
-            json.dump(configs, f, indent=2)
+        with CONFIG_LOCK:
+            configs = self._load_all_configs()
+            configs[env_name] = {
+                "ai_provider": config.ai_provider,
+                "environment_path": config.environment_path,
+                "node_version": config.node_version,
+                "claude_code_version": config.claude_code_version,
+                "ollama_model": config.ollama_model,
+                "ollama_url": config.ollama_url
+            }
+            self._write_all_configs(configs)
+    
+    def _write_all_configs(self, configs: Dict[str, Any]):
+        """Replace config.json atomically so readers never see a partial file"""
+        fd, temp_path = tempfile.mkstemp(dir=self.base_path, prefix="config.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(configs, f, indent=2)
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
     
     def _load_all_configs(self) -> Dict[str, Any]:
         """Load all environment configurations"""
@@ -304,10 +355,10 @@ node_modules\\.bin\\claude.cmd %*
             shutil.rmtree(env_path)
         
         # Remove from config
-        configs = self._load_all_configs()
-        if env_name in configs:
-            del configs[env_name]
-            with open(self.config_path, "w") as f:
-                json.dump(configs, f, indent=2)
+        with CONFIG_LOCK:
+            configs = self._load_all_configs()
+            if env_name in configs:
+                del configs[env_name]
+                self._write_all_configs(configs)
         
         return True
\ No newline at end of file
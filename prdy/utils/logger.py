@@ -60,33 +60,37 @@ class PRDLogger:
         self.logger.addHandler(error_handler)
         self.logger.addHandler(console_handler)
     
-    def info(self, message: str, **kwargs):
-        """Log info message"""
-        self.logger.info(message, **kwargs)
+    def is_enabled_for(self, level: int) -> bool:
+        """Check if a message at this level would be logged"""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message"""
-        self.logger.debug(message, **kwargs)
+    def info(self, message: str, *args, **kwargs):
+        """Log info message; %-style args are only formatted if the record is emitted"""
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs):
-        """Log warning message"""
-        self.logger.warning(message, **kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message; %-style args are only formatted if the record is emitted"""
+        self.logger.debug(message, *args, **kwargs)
     
-    def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message; %-style args are only formatted if the record is emitted"""
+        self.logger.warning(message, *args, **kwargs)
+    
+    def error(self, message: str, *args, exception: Optional[Exception] = None, **kwargs):
         """Log error message with optional exception"""
         if exception:
-            self.logger.error(f"{message}: {str(exception)}", **kwargs)
+            self.logger.error("%s: %s", message % args if args else message, exception, **kwargs)
             self.logger.debug(traceback.format_exc())
         else:
-            self.logger.error(message, **kwargs)
+            self.logger.error(message, *args, **kwargs)
     
-    def critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
+    def critical(self, message: str, *args, exception: Optional[Exception] = None, **kwargs):
         """Log critical message"""
         if exception:
-            self.logger.critical(f"{message}: {str(exception)}", **kwargs)
+            self.logger.critical("%s: %s", message % args if args else message, exception, **kwargs)
             self.logger.debug(traceback.format_exc())
         else:
-            self.logger.critical(message, **kwargs)
+            self.logger.critical(message, *args, **kwargs)
     
     def log_operation(self, operation: str, status: str, details: str = ""):
         """Log an operation with standardized format"""
@@ -5,15 +5,20 @@ PRD Service - Core business logic for PRD generation and management
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from ..models.database import get_db_sync
 from ..models.prd import (
-    PRDSession, Task, PRDSessionCreate, PRDContent, TaskCreate,
+    PRDSession, Task, TaskDependency, PRDSessionCreate, PRDContent, TaskCreate,
     ProductType, IndustryType, ComplexityLevel, TaskStatus, TaskDifficulty
 )
 
+# Statements built once so SQLAlchemy's compiled cache is hit on every call
+SESSIONS_BY_RECENCY = select(PRDSession).order_by(PRDSession.updated_at.desc())
+TASKS_FOR_SESSION = select(Task).where(Task.session_id == bindparam("session_id"))
+
 
 class PRDService:
     """Service class for PRD operations"""
@@ -25,9 +30,9 @@ class PRDService:
         """Create a new PRD session"""
         session = PRDSession(
             name=session_data.name,
-            product_type=session_data.product_type.value,
-            industry_type=session_data.industry_type.value,
-            complexity_level=session_data.complexity_level.value,
+            product_type=session_data.product_type,
+            industry_type=session_data.industry_type,
+            complexity_level=session_data.complexity_level,
             data={}
         )
         
@@ -42,11 +47,15 @@ class PRDService:
     
     def get_session(self, session_id: int) -> Optional[PRDSession]:
         """Get a PRD session by ID"""
-        return self.db.query(PRDSession).filter(PRDSession.id == session_id).first()
+        return self.db.get(PRDSession, session_id)
     
     def list_sessions(self) -> List[PRDSession]:
         """List all PRD sessions"""
-        return self.db.query(PRDSession).order_by(PRDSession.updated_at.desc()).all()
+        return self.db.scalars(SESSIONS_BY_RECENCY).all()
+    
+    def iter_sessions(self, batch_size: int = 100) -> Iterator[PRDSession]:
+        """Stream PRD sessions in batches, most recently updated first"""
+        yield from self.db.scalars(SESSIONS_BY_RECENCY.execution_options(yield_per=batch_size))
     
     def update_session_data(self, session_id: int, data: Dict[str, Any]) -> bool:
         """Update session data with interview answers"""
@@ -76,48 +85,43 @@ class PRDService:
         if not session or not session.data:
             return None
         
+        prd_content = self._build_prd_content(session)
+        self._save_generated_prd(session, prd_content)
+        
+        return prd_content
+    
+    def _build_prd_content(self, session: PRDSession) -> PRDContent:
+        """Build PRD content from session data"""
         # Extract data from session
         data = session.data
         
-        # Create PRD content object
-        prd_content = PRDContent(
+        # Create PRD content object; generated sections are validated into models here
+        return PRDContent(
             project_name=data.get("project_name", session.name),
             executive_summary=self._generate_executive_summary(session, data),
-            product_type=ProductType(session.product_type),
-            industry_type=IndustryType(session.industry_type),
-            complexity_level=ComplexityLevel(session.complexity_level),
+            product_type=session.product_type,
+            industry_type=session.industry_type,
+            complexity_level=session.complexity_level,
             problem_statement=data.get("problem_statement", ""),
             target_market=data.get("target_audience", ""),
             value_proposition=data.get("value_proposition", ""),
             success_metrics=self._parse_list_field(data.get("success_metrics", "")),
+            business_requirements=self._generate_business_requirements(data),
+            personas=self._generate_personas(data),
+            features=self._generate_features(data),
+            technical_requirements=self._generate_technical_requirements(session, data),
+            compliance_requirements=self._generate_compliance_requirements(session, data),
+            timeline=self._generate_timeline(session, data),
+            milestones=self._generate_milestones(session, data),
         )
-        
-        # Add business requirements
-        prd_content.business_requirements = self._generate_business_requirements(data)
-        
-        # Add personas
-        prd_content.personas = self._generate_personas(data)
-        
-        # Add features
-        prd_content.features = self._generate_features(data)
-        
-        # Add technical requirements
-        prd_content.technical_requirements = self._generate_technical_requirements(session, data)
-        
-        # Add compliance requirements
-        prd_content.compliance_requirements = self._generate_compliance_requirements(session, data)
-        
-        # Add timeline and milestones
-        prd_content.timeline = self._generate_timeline(session, data)
-        prd_content.milestones = self._generate_milestones(session, data)
-        
-        # Save generated content back to session
-        session.data["generated_prd"] = prd_content.dict()
+    
+    def _save_generated_prd(self, session: PRDSession, prd_content: PRDContent):
+        """Save generated content back to session"""
+        # Reassign so the JSON column change is picked up on commit
+        session.data = {**session.data, "generated_prd": prd_content.model_dump(mode="json")}
         session.status = "generated"
         session.completion_percentage = 100
         self.db.commit()
-        
-        return prd_content
     
     def export_prd(self, session_id: int, format: str) -> Optional[str]:
         """Export PRD to specified format"""
@@ -127,7 +131,7 @@ class PRDService:
         
         # Get or generate PRD content
         if "generated_prd" in session.data:
-            prd_content = PRDContent(**session.data["generated_prd"])
+            prd_content = PRDContent.model_validate(session.data["generated_prd"])
         else:
             prd_content = self.generate_prd_content(session_id)
             if not prd_content:
@@ -158,7 +162,7 @@ class PRDService:
     
     def get_session_tasks(self, session_id: int) -> List[Task]:
         """Get all tasks for a session"""
-        return self.db.query(Task).filter(Task.session_id == session_id).all()
+        return self.db.scalars(TASKS_FOR_SESSION, {"session_id": session_id}).all()
     
     def create_task(self, session_id: int, task_data: TaskCreate) -> Task:
         """Create a new task"""
@@ -167,13 +171,16 @@ class PRDService:
             identifier=task_data.identifier,
             title=task_data.title,
             description=task_data.description,
-            status=task_data.status.value,
-            difficulty=task_data.difficulty.value,
+            status=task_data.status,
+            difficulty=task_data.difficulty,
             priority=task_data.priority,
             estimated_hours=task_data.estimated_hours,
-            dependencies=task_data.dependencies,
             parent_task_id=task_data.parent_task_id
         )
+        if task_data.dependencies:
+            task.dependencies = self.db.scalars(
+                select(Task).where(Task.identifier.in_(task_data.dependencies))
+            ).all()
         
         self.db.add(task)
         self.db.commit()
@@ -181,13 +188,37 @@ class PRDService:
         
         return task
     
+    def create_tasks(self, session_id: int, tasks: List[TaskCreate]) -> None:
+        """Create several tasks and their dependency links in a single transaction"""
+        Task.bulk_create(self.db, [
+            {**task_data.model_dump(exclude={"dependencies"}), "session_id": session_id}
+            for task_data in tasks
+        ])
+        
+        identifiers = {dep for task_data in tasks for dep in task_data.dependencies}
+        identifiers.update(task_data.identifier for task_data in tasks if task_data.dependencies)
+        if identifiers:
+            ids_by_identifier = dict(self.db.execute(
+                select(Task.identifier, Task.id).where(Task.identifier.in_(identifiers))
+            ).all())
+            links = [
+                {"task_id": ids_by_identifier[task_data.identifier], "depends_on_id": ids_by_identifier[dep]}
+                for task_data in tasks
+                for dep in task_data.dependencies
+                if dep in ids_by_identifier
+            ]
+            if links:
+                self.db.execute(TaskDependency.__table__.insert(), links)
+        
+        self.db.commit()
+    
     def update_task_status(self, task_id: int, status: TaskStatus) -> bool:
         """Update task status"""
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        task = self.db.get(Task, task_id)
         if not task:
             return False
         
-        task.status = status.value
+        task.status = status
         task.updated_at = datetime.utcnow()
         
         if status == TaskStatus.COMPLETED:
@@ -202,7 +233,11 @@ class PRDService:
         if not session:
             return False
         
-        # Delete associated tasks first
+        # Delete dependency links and associated tasks first
+        task_ids = select(Task.id).where(Task.session_id == session_id)
+        self.db.query(TaskDependency).filter(
+            TaskDependency.task_id.in_(task_ids) | TaskDependency.depends_on_id.in_(task_ids)
+        ).delete(synchronize_session=False)
         self.db.query(Task).filter(Task.session_id == session_id).delete()
         
         # Delete session
@@ -266,19 +301,18 @@ class PRDService:
             ])
         
         # Create tasks in database
-        for task_data in base_tasks:
-            self.create_task(session_id, task_data)
+        self.create_tasks(session_id, base_tasks)
     
     def _count_expected_questions(self, session: PRDSession) -> int:
         """Count expected number of questions for the session type"""
         # This is a simplified count - in real implementation would use QuestionEngine
         base_count = 10
         
-        if session.complexity_level == ComplexityLevel.SIMPLE.value:
+        if session.complexity_level == ComplexityLevel.SIMPLE:
             return base_count
-        elif session.complexity_level == ComplexityLevel.MODERATE.value:
+        elif session.complexity_level == ComplexityLevel.MODERATE:
             return base_count + 5
-        elif session.complexity_level == ComplexityLevel.COMPLEX.value:
+        elif session.complexity_level == ComplexityLevel.COMPLEX:
             return base_count + 15
         else:  # Enterprise
             return base_count + 25
@@ -299,10 +333,10 @@ class PRDService:
         
         # Add complexity and timeline context
         complexity_desc = {
-            ComplexityLevel.SIMPLE.value: "a streamlined solution designed for rapid deployment",
-            ComplexityLevel.MODERATE.value: "a comprehensive solution with standard features",
-            ComplexityLevel.COMPLEX.value: "an advanced solution with sophisticated capabilities",
-            ComplexityLevel.ENTERPRISE.value: "an enterprise-grade solution with comprehensive features"
+            ComplexityLevel.SIMPLE: "a streamlined solution designed for rapid deployment",
+            ComplexityLevel.MODERATE: "a comprehensive solution with standard features",
+            ComplexityLevel.COMPLEX: "an advanced solution with sophisticated capabilities",
+            ComplexityLevel.ENTERPRISE: "an enterprise-grade solution with comprehensive features"
         }
         
         summary += f"This is {complexity_desc.get(session.complexity_level, 'a solution')} "
@@ -410,7 +444,7 @@ class PRDService:
         })
         
         # Add product-specific requirements
-        if session.product_type == ProductType.MOBILE_APP.value:
+        if session.product_type == ProductType.MOBILE_APP:
             if data.get("offline_functionality"):
                 requirements.append({
                     "category": "functionality",
@@ -425,14 +459,14 @@ class PRDService:
         """Generate compliance requirements based on industry"""
         requirements = []
         
-        if session.industry_type == IndustryType.HEALTHCARE.value:
+        if session.industry_type == IndustryType.HEALTHCARE:
             requirements.extend([
                 "HIPAA compliance for protected health information",
                 "Patient data encryption and access controls",
                 "Audit trail for all data access"
             ])
         
-        elif session.industry_type == IndustryType.FINANCE.value:
+        elif session.industry_type == IndustryType.FINANCE:
             requirements.extend([
                 "PCI DSS compliance for payment processing",
                 "SOX compliance for financial reporting",
@@ -489,10 +523,10 @@ class PRDService:
 {chr(10).join(f"- {metric}" for metric in prd_content.success_metrics)}
 
 ## Key Features
-{chr(10).join(f"### {feature['name']}{chr(10)}{feature['description']}{chr(10)}" for feature in prd_content.features)}
+{chr(10).join(f"### {feature.name}{chr(10)}{feature.description}{chr(10)}" for feature in prd_content.features)}
 
 ## Technical Requirements
-{chr(10).join(f"- **{req['category'].title()}**: {req['requirement']}" for req in prd_content.technical_requirements)}
+{chr(10).join(f"- **{req.category.title()}**: {req.requirement}" for req in prd_content.technical_requirements)}
 
 ## Timeline
 {chr(10).join(f"- **{phase.title()}**: {duration}" for phase, duration in prd_content.timeline.items())}
@@ -525,10 +559,10 @@ SUCCESS METRICS
 {chr(10).join(f"• {metric}" for metric in prd_content.success_metrics)}
 
 KEY FEATURES
-{chr(10).join(f"{feature['name']}: {feature['description']}" for feature in prd_content.features)}
+{chr(10).join(f"{feature.name}: {feature.description}" for feature in prd_content.features)}
 
 TECHNICAL REQUIREMENTS
-{chr(10).join(f"• {req['category'].upper()}: {req['requirement']}" for req in prd_content.technical_requirements)}
+{chr(10).join(f"• {req.category.upper()}: {req.requirement}" for req in prd_content.technical_requirements)}
 
 TIMELINE
 {chr(10).join(f"• {phase.upper()}: {duration}" for phase, duration in prd_content.timeline.items())}
@@ -584,8 +618,8 @@ COMPLIANCE REQUIREMENTS
             # Features
             story.append(Paragraph("Key Features", styles['Heading2']))
             for feature in prd_content.features:
-                story.append(Paragraph(f"<b>{feature['name']}</b>", styles['Normal']))
-                story.append(Paragraph(feature['description'], styles['Normal']))
+                story.append(Paragraph(f"<b>{feature.name}</b>", styles['Normal']))
+                story.append(Paragraph(feature.description, styles['Normal']))
                 story.append(Spacer(1, 6))
             
             doc.build(story)
@@ -191,6 +191,16 @@ class SettingsManager:
         else:
             raise ValueError(f"Unknown setting: {key}")
     
+    def update_settings(self, updates: Dict[str, Any]):
+        """Update several settings with a single save"""
+        unknown = [key for key in updates if not hasattr(self.settings, key)]
+        if unknown:
+            raise ValueError(f"Unknown setting: {', '.join(unknown)}")
+        
+        for key, value in updates.items():
+            setattr(self.settings, key, value)
+        self._save_settings()
+    
     def update_state(self, key: str, value: Any):
         """Update application state"""
         if hasattr(self.state, key):
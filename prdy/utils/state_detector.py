@@ -7,7 +7,8 @@ import os
 import sys
 import subprocess
 import shutil
-import importlib.util
+import importlib.metadata
+import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import time
@@ -18,13 +19,38 @@ from .settings_manager import SettingsManager
 logger = get_logger("state_detector")
 
 
+def normalize_distribution_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def get_installed_distributions() -> frozenset:
+    """Get the normalized names of all installed distributions in one metadata scan"""
+    return frozenset(
+        normalize_distribution_name(dist.metadata['Name'])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata['Name']
+    )
+
+
+# Probes whose results get_probe() may reuse, mapped to their system state key
+CACHED_PROBES = {
+    '_check_dependencies': 'dependencies',
+    '_check_system_tools': 'system_tools',
+    '_check_ai_providers': 'ai_providers',
+    '_check_database': 'database',
+    '_check_permissions': 'permissions',
+    '_check_network_connectivity': 'network',
+}
+
+
 class StateDetector:
     """Detects and validates application state"""
     
     def __init__(self, settings_manager: SettingsManager = None):
         self.settings_manager = settings_manager or SettingsManager()
         self.detection_cache = {}
-        self.cache_timeout = 300  # 5 minutes
+        self.cache_timeout = 30  # seconds
     
     def get_complete_system_state(self) -> Dict[str, any]:
         """Get comprehensive system state"""
@@ -52,9 +78,31 @@ class StateDetector:
             'ollama_available': state['ai_providers']['ollama']['available']
         })
         
+        # Seed the probe cache so follow-up checks reuse this scan
+        now = time.monotonic()
+        for probe_name, state_key in CACHED_PROBES.items():
+            self.detection_cache[probe_name] = (now, state[state_key])
+        
         logger.info(f"System state detection completed. Bootstrap status: {state['bootstrap_status']['is_ready']}")
         return state
     
+    def get_probe(self, probe_name: str) -> Dict[str, any]:
+        """Run a probe such as '_check_dependencies', reusing a result younger than cache_timeout"""
+        cached = self.detection_cache.get(probe_name)
+        if cached and time.monotonic() - cached[0] < self.cache_timeout:
+            return cached[1]
+        
+        result = getattr(self, probe_name)()
+        self.detection_cache[probe_name] = (time.monotonic(), result)
+        return result
+    
+    def clear_cache(self, *probe_names: str):
+        """Forget cached probe results, or all of them when no names are given"""
+        if not probe_names:
+            self.detection_cache.clear()
+        for probe_name in probe_names:
+            self.detection_cache.pop(probe_name, None)
+    
     def _check_python_environment(self) -> Dict[str, any]:
         """Check Python environment"""
         try:
@@ -87,14 +135,12 @@ class StateDetector:
         installed = []
         missing = []
         
+        # Match distribution names, not import names (pyyaml installs "yaml")
+        available = get_installed_distributions()
         for dep in required_deps:
-            try:
-                spec = importlib.util.find_spec(dep)
-                if spec is not None:
-                    installed.append(dep)
-                else:
-                    missing.append(dep)
-            except ImportError:
+            if normalize_distribution_name(dep) in available:
+                installed.append(dep)
+            else:
                 missing.append(dep)
         
         result = {
@@ -368,10 +414,10 @@ class StateDetector:
         """Quick health check for common issues"""
         return {
             'python_ok': sys.version_info >= (3, 8),
-            'dependencies_ok': self._check_dependencies()['all_installed'],
-            'database_ok': self._check_database()['initialized'],
-            'permissions_ok': self._check_permissions()['app_directory_writable'],
-            'network_ok': self._check_network_connectivity()['internet']
+            'dependencies_ok': self.get_probe('_check_dependencies')['all_installed'],
+            'database_ok': self.get_probe('_check_database')['initialized'],
+            'permissions_ok': self.get_probe('_check_permissions')['app_directory_writable'],
+            'network_ok': self.get_probe('_check_network_connectivity')['internet']
         }
     
     def get_installation_recommendations(self, state: Dict[str, any]) -> List[str]:
@@ -324,6 +324,14 @@ if [ "$package_installed" = false ]; then
     exit 1
 fi
 
+# Pre-compile PRDY sources so the first launch does not pay for it
+echo "⚙️  Pre-compiling PRDY modules..."
+if python3 -m compileall -q -j 0 prdy 2>/dev/null; then
+    echo "✅ PRDY modules compiled"
+else
+    echo "⚠️  Pre-compilation failed, modules will be compiled on first use"
+fi
+
 # Final validation - test that PRDY is actually working
 echo "🧪 Performing final validation..."
 